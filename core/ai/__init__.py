@@ -57,6 +57,9 @@ class ModelManager:
         self.models: Dict[str, Any] = {}
         self.configs: Dict[str, ModelConfig] = {}
         
+        # Parsed configurations keyed by model ID, with the file mtime they were read at
+        self._config_cache: Dict[str, Tuple[int, ModelConfig]] = {}
+        
         # Ensure models directory exists
         os.makedirs(self.models_dir, exist_ok=True)
     
@@ -87,10 +90,7 @@ class ModelManager:
         
         try:
             # Load model configuration
-            with open(config_path, 'r') as f:
-                config_dict = json.load(f)
-            
-            config = ModelConfig(**config_dict)
+            config = self._read_config(model_id, config_path)
             self.configs[model_id] = config
             
             # Load model based on model type
@@ -228,10 +228,7 @@ class ModelManager:
                 
                 try:
                     # Load model configuration
-                    with open(config_path, 'r') as f:
-                        config_dict = json.load(f)
-                    
-                    config = ModelConfig(**config_dict)
+                    config = self._read_config(model_id, config_path)
                     
                     # Check if model file exists
                     model_path = os.path.join(self.models_dir, f"{model_id}.model")
@@ -253,6 +250,25 @@ class ModelManager:
         
         return available_models
     
+    # Helper methods
+    
+    def _read_config(self, model_id: str, config_path: str) -> ModelConfig:
+        """Read a model configuration, reusing the cached parse if the file is unchanged."""
+        mtime = os.stat(config_path).st_mtime_ns
+        
+        cached = self._config_cache.get(model_id)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        
+        # Parsed with json.loads: configs written by json.dump may contain NaN or Infinity
+        with open(config_path, 'rb') as f:
+            config_dict = json.loads(f.read())
+        
+        config = ModelConfig(**config_dict)
+        self._config_cache[model_id] = (mtime, config)
+        
+        return config
+    
     # Helper methods for loading different model types
     
     async def _load_price_prediction_model(
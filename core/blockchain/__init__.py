@@ -11,6 +11,7 @@ import logging
 import base64
 import json
 import time
+import weakref
 from decimal import Decimal
 from typing import Dict, List, Optional, Union, Any, Tuple, Callable
 
@@ -20,6 +21,62 @@ from pydantic import BaseModel
 # Setup logger
 logger = logging.getLogger("core.blockchain")
 
+# Shared HTTP session for all BlockchainClient instances, bound to the event loop that created it
+_session: Optional[aiohttp.ClientSession] = None
+_session_loop: Optional[asyncio.AbstractEventLoop] = None
+
+# Clients connected through the shared session; it is closed when the last one disconnects
+_session_clients: "weakref.WeakSet[BlockchainClient]" = weakref.WeakSet()
+
+
+async def _close_session(session: aiohttp.ClientSession) -> None:
+    """Close an HTTP session, logging rather than raising on failure."""
+    try:
+        await session.close()
+    except Exception as e:
+        logger.error(f"Error closing HTTP session: {str(e)}")
+
+
+async def get_http_session() -> aiohttp.ClientSession:
+    """
+    Get the HTTP session shared by all blockchain clients.
+    
+    A new session is created lazily on first use, or when the previous one
+    was closed or belongs to a different event loop. A session left over from
+    another event loop is closed.
+    
+    Returns:
+        aiohttp.ClientSession: Shared HTTP session
+    """
+    global _session, _session_loop
+    
+    loop = asyncio.get_running_loop()
+    if _session is None or _session.closed or _session_loop is not loop:
+        # Swap in the new session before awaiting, so concurrent callers share it. Clients
+        # registered on the old session no longer use this one.
+        stale = _session
+        _session = aiohttp.ClientSession()
+        _session_loop = loop
+        _session_clients.clear()
+        
+        if stale is not None and not stale.closed:
+            await _close_session(stale)
+    
+    return _session
+
+
+async def close_http_session() -> None:
+    """Close the HTTP session shared by all blockchain clients."""
+    global _session, _session_loop
+    
+    session = _session
+    _session = None
+    _session_loop = None
+    _session_clients.clear()
+    
+    if session is not None and not session.closed:
+        await _close_session(session)
+
 
 class NetworkConfig(BaseModel):
     """Model representing configuration for a blockchain network."""
@@ -79,8 +136,9 @@ class BlockchainClient:
         logger.info(f"Connecting to {self.network_config.name} network")
         
         try:
-            # Create HTTP session
-            self.session = aiohttp.ClientSession()
+            # Reuse the shared HTTP session
+            self.session = await get_http_session()
+            _session_clients.add(self)
             
             # Test connection
             response = await self._send_rpc_request("getHealth", [])
@@ -106,9 +164,12 @@ class BlockchainClient:
         logger.info(f"Disconnecting from {self.network_config.name} network")
         
         try:
-            if self.session:
-                await self.session.close()
-                self.session = None
+            self.session = None
+            
+            # Close the shared session once no connected client is using it
+            _session_clients.discard(self)
+            if not _session_clients:
+                await close_http_session()
             
             logger.info(f"Disconnected from {self.network_config.name} network")
             return True
@@ -398,7 +459,7 @@ class BlockchainClient:
         retry_count: int = 0,
     ) -> Optional[Dict[str, Any]]:
         """Send an RPC request to the blockchain network."""
-        if not self.session:
+        if not self.session or self.session.closed:
             await self.connect()
         
         try:
@@ -577,6 +638,8 @@ async def close_all_clients() -> None:
         await client.disconnect()
     
     _clients = {}
+    
+    await close_http_session()
 
 
 # Example usage
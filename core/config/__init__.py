@@ -8,15 +8,56 @@ Author: ECLIPSEMOON
 
 import os
 import json
+import math
+import functools
 import logging
 import yaml
 from typing import Dict, List, Optional, Union, Any, Callable
 from decimal import Decimal
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Setup logger
 logger = logging.getLogger("core.config")
 
 
+def _has_non_finite(data: Any) -> bool:
+    """Check whether nested lists and dicts contain NaN or infinite floats."""
+    if isinstance(data, float):
+        return not math.isfinite(data)
+    elif isinstance(data, dict):
+        return any(_has_non_finite(v) for v in data.values())
+    elif isinstance(data, list):
+        return any(_has_non_finite(item) for item in data)
+    else:
+        return False
+
+
+def _json_dumps(data: Any) -> bytes:
+    """
+    Serialize configuration data to indented UTF-8 JSON bytes, using orjson when available.
+    
+    Both backends stringify non-string keys and write non-ASCII text unescaped. Data
+    orjson cannot write faithfully (integers wider than 64 bits, NaN and infinities)
+    goes through the stdlib encoder.
+    """
+    if orjson is not None and not _has_non_finite(data):
+        try:
+            return orjson.dumps(
+                data,
+                default=str,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+            )
+        except TypeError:
+            # orjson rejects some values the stdlib accepts (e.g. integers wider than 64 bits)
+            pass
+    
+    return json.dumps(data, default=str, indent=2, ensure_ascii=False).encode('utf-8')
+
+
 class ConfigManager:
     """Manager for configuration files."""
     
@@ -70,8 +111,8 @@ class ConfigManager:
         
         try:
             # Load configuration from file
-            with open(file_path, 'r') as f:
-                config = json.load(f)
+            with open(file_path, 'rb') as f:
+                config = json.loads(f.read())
             
             # Convert string values to Decimal where needed
             config = self._convert_decimal_strings(config)
@@ -118,8 +159,8 @@ class ConfigManager:
             config_to_save = self._prepare_for_json(config)
             
             # Save configuration to file
-            with open(file_path, 'w') as f:
-                json.dump(config_to_save, f, indent=2)
+            with open(file_path, 'wb') as f:
+                f.write(_json_dumps(config_to_save))
             
             logger.info(f"Configuration {config_name} saved successfully")
             return True
@@ -128,6 +169,54 @@ class ConfigManager:
             logger.error(f"Error saving configuration {config_name}: {str(e)}")
             return False
     
+    def save_configs_bulk(
+        self,
+        configs: Dict[str, Dict[str, Any]],
+    ) -> bool:
+        """
+        Save several configuration files in one pass.
+        
+        This is the recommended path when persisting many configurations:
+        each file is serialized to bytes up front and written with one
+        unbuffered write.
+        
+        Args:
+            configs: Mapping of configuration name to configuration data
+            
+        Returns:
+            bool: True if all configurations were saved, False otherwise
+        """
+        logger.info(f"Saving {len(configs)} configurations")
+        
+        success = True
+        
+        for config_name, config in configs.items():
+            # Update in-memory config
+            self.configs[config_name] = config
+            
+            # Determine file path
+            file_path = os.path.join(self.config_dir, f"{config_name}.json")
+            
+            try:
+                # Convert Decimal objects to strings for JSON serialization
+                data = _json_dumps(self._prepare_for_json(config))
+                
+                # Save configuration to file
+                fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+                try:
+                    view = memoryview(data)
+                    while view:
+                        view = view[os.write(fd, view):]
+                finally:
+                    os.close(fd)
+            
+            except Exception as e:
+                logger.error(f"Error saving configuration {config_name}: {str(e)}")
+                success = False
+        
+        logger.info(f"Saved {len(configs)} configurations")
+        return success
+    
     def get_config(
         self,
         config_name: str,
@@ -263,14 +352,15 @@ class ConfigManager:
                 config_name = os.path.splitext(os.path.basename(file_path))[0]
             
             # Load configuration from file
-            with open(file_path, 'r') as f:
-                if file_path.endswith(".json"):
-                    config = json.load(f)
-                elif file_path.endswith((".yaml", ".yml")):
+            if file_path.endswith(".json"):
+                with open(file_path, 'rb') as f:
+                    config = json.loads(f.read())
+            elif file_path.endswith((".yaml", ".yml")):
+                with open(file_path, 'r') as f:
                     config = yaml.safe_load(f)
-                else:
-                    logger.error(f"Unsupported file format: {file_path}")
-                    return False
+            else:
+                logger.error(f"Unsupported file format: {file_path}")
+                return False
             
             # Convert string values to Decimal where needed
             config = self._convert_decimal_strings(config)
@@ -316,14 +406,15 @@ class ConfigManager:
             config_to_export = self._prepare_for_json(config)
             
             # Export configuration to file
-            with open(file_path, 'w') as f:
-                if format.lower() == "json":
-                    json.dump(config_to_export, f, indent=2)
-                elif format.lower() in ("yaml", "yml"):
+            if format.lower() == "json":
+                with open(file_path, 'wb') as f:
+                    f.write(_json_dumps(config_to_export))
+            elif format.lower() in ("yaml", "yml"):
+                with open(file_path, 'w') as f:
                     yaml.dump(config_to_export, f, default_flow_style=False)
-                else:
-                    logger.error(f"Unsupported format: {format}")
-                    return False
+            else:
+                logger.error(f"Unsupported format: {format}")
+                return False
             
             logger.info(f"Configuration {config_name} exported successfully to {file_path}")
             return True
@@ -371,13 +462,15 @@ class ConfigManager:
             return data
 
 
-# Singleton instance of ConfigManager
-_config_manager = None
+# Singleton instances of ConfigManager, one per absolute configuration directory
+@functools.lru_cache(maxsize=None)
+def _get_config_manager(config_dir: str) -> ConfigManager:
+    return ConfigManager(config_dir)
 
 
 def get_config_manager(config_dir: Optional[str] = None) -> ConfigManager:
     """
-    Get the singleton instance of ConfigManager.
+    Get the singleton instance of ConfigManager for a configuration directory.
     
     Args:
         config_dir: Directory to store configuration files (if None, use default)
@@ -385,12 +478,8 @@ def get_config_manager(config_dir: Optional[str] = None) -> ConfigManager:
     Returns:
         ConfigManager: Singleton instance of ConfigManager
     """
-    global _config_manager
-    
-    if _config_manager is None:
-        _config_manager = ConfigManager(config_dir)
-    
-    return _config_manager
+    config_dir = config_dir or os.path.join(os.path.expanduser("~"), ".eclipsemoon", "config")
+    return _get_config_manager(os.path.abspath(config_dir))
 
 
 # Example usage
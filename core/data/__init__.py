@@ -6,15 +6,18 @@ Core Data Module
 Author: ECLIPSEMOON
 """
 
+import io
 import os
 import json
 import logging
 import sqlite3
 import csv
 import pickle
+import contextlib
+import functools
 from datetime import datetime
 from decimal import Decimal
-from typing import Dict, List, Optional, Union, Any, Tuple, Callable
+from typing import Dict, List, Optional, Union, Any, Tuple, Callable, BinaryIO, Iterator
 
 import pandas as pd
 import numpy as np
@@ -68,6 +71,9 @@ class DataManager:
         self.sources: Dict[str, DataSource] = {}
         self.connections: Dict[str, Any] = {}
         
+        # Idle SQLite connections keyed by (source ID, database path), reused by later connects
+        self._sqlite_pool: Dict[Tuple[str, str], sqlite3.Connection] = {}
+        
         # Ensure data directory exists
         os.makedirs(self.data_dir, exist_ok=True)
     
@@ -369,7 +375,7 @@ class DataManager:
     async def save_data(
         self,
         data: Any,
-        file_path: str,
+        file_path: Union[str, BinaryIO],
         format: str = "csv",
     ) -> bool:
         """
@@ -377,7 +383,7 @@ class DataManager:
         
         Args:
             data: Data to save
-            file_path: Path to save the data to
+            file_path: Path or binary file-like object to save the data to
             format: Format to save as (csv, json, pickle)
             
         Returns:
@@ -387,7 +393,8 @@ class DataManager:
         
         try:
             # Create directory if it doesn't exist
-            os.makedirs(os.path.dirname(os.path.abspath(file_path)), exist_ok=True)
+            if isinstance(file_path, (str, os.PathLike)):
+                os.makedirs(os.path.dirname(os.path.abspath(file_path)), exist_ok=True)
             
             # Save data based on format
             if format.lower() == "csv":
@@ -397,7 +404,7 @@ class DataManager:
                     df = pd.DataFrame(data)
                     df.to_csv(file_path, index=False)
                 else:
-                    with open(file_path, 'w', newline='') as f:
+                    with self._open_file(file_path, 'w', newline='') as f:
                         if isinstance(data, list) and all(isinstance(item, list) for item in data):
                             writer = csv.writer(f)
                             writer.writerows(data)
@@ -406,11 +413,11 @@ class DataManager:
                             return False
             
             elif format.lower() == "json":
-                with open(file_path, 'w') as f:
+                with self._open_file(file_path, 'w') as f:
                     json.dump(self._prepare_for_json(data), f, indent=2)
             
             elif format.lower() == "pickle":
-                with open(file_path, 'wb') as f:
+                with self._open_file(file_path, 'wb') as f:
                     pickle.dump(data, f)
             
             else:
@@ -426,26 +433,32 @@ class DataManager:
     
     async def load_data(
         self,
-        file_path: str,
+        file_path: Union[str, BinaryIO],
         format: Optional[str] = None,
     ) -> Optional[Any]:
         """
         Load data from a file.
         
         Args:
-            file_path: Path to load the data from
-            format: Format to load as (csv, json, pickle, auto)
+            file_path: Path or binary file-like object to load the data from
+            format: Format to load as (csv, json, pickle, auto); required for file-like objects
             
         Returns:
             Optional[Any]: Loaded data if successful, None otherwise
         """
         logger.info(f"Loading data from {file_path}")
         
+        is_path = isinstance(file_path, (str, os.PathLike))
+        
         # Check if file exists
-        if not os.path.exists(file_path):
+        if is_path and not os.path.exists(file_path):
             logger.error(f"File {file_path} not found")
             return None
         
+        if not is_path and format is None:
+            logger.error("Format must be specified when loading from a file-like object")
+            return None
+        
         try:
             # Determine format if not provided
             if format is None:
@@ -465,14 +478,14 @@ class DataManager:
                 data = pd.read_csv(file_path)
             
             elif format.lower() == "json":
-                with open(file_path, 'r') as f:
+                with self._open_file(file_path, 'r') as f:
                     data = json.load(f)
                 
                 # Convert string values to Decimal where needed
                 data = self._convert_decimal_strings(data)
             
             elif format.lower() == "pickle":
-                with open(file_path, 'rb') as f:
+                with self._open_file(file_path, 'rb') as f:
                     data = pickle.load(f)
             
             else:
@@ -486,6 +499,24 @@ class DataManager:
             logger.error(f"Error loading data from {file_path}: {str(e)}")
             return None
     
+    async def close(self) -> None:
+        """Close all data source connections and pooled SQLite connections."""
+        logger.info("Shutting down data manager")
+        
+        for source_id in list(self.connections):
+            await self.close_connection(source_id)
+        
+        await self.close_pool()
+    
+    async def close_pool(self) -> None:
+        """Close all idle pooled SQLite connections."""
+        logger.info(f"Closing {len(self._sqlite_pool)} pooled SQLite connections")
+        
+        for connection in self._sqlite_pool.values():
+            connection.close()
+        
+        self._sqlite_pool = {}
+    
     # Helper methods for connecting to different data sources
     
     async def _connect_database(self, source: DataSource) -> Optional[Any]:
@@ -506,6 +537,12 @@ class DataManager:
                 logger.error(f"Missing database path for SQLite source {source.source_id}")
                 return None
             
+            # Reuse an idle pooled connection for this source if one is available
+            pool_key = (source.source_id, db_path)
+            connection = self._sqlite_pool.pop(pool_key, None)
+            if connection is not None:
+                return connection
+            
             # Ensure directory exists
             os.makedirs(os.path.dirname(os.path.abspath(db_path)), exist_ok=True)
             
@@ -550,9 +587,31 @@ class DataManager:
         return connection_info
     
     async def _close_database_connection(self, connection: Any) -> None:
-        """Close a database connection."""
+        """Close a database connection, returning SQLite connections to the pool."""
         if isinstance(connection, sqlite3.Connection):
-            connection.close()
+            pool_key = self._sqlite_pool_key(connection)
+            
+            if pool_key is not None and pool_key not in self._sqlite_pool:
+                # Discard uncommitted changes, as close() would, before the connection is reused
+                connection.rollback()
+                self._sqlite_pool[pool_key] = connection
+            else:
+                connection.close()
+    
+    def _sqlite_pool_key(self, connection: sqlite3.Connection) -> Optional[Tuple[str, str]]:
+        """Get the pool key for an open SQLite connection, or None if it must not be pooled."""
+        for source_id, open_connection in self.connections.items():
+            if open_connection is connection:
+                source = self.sources.get(source_id)
+                db_path = source.connection_info.get("path") if source else None
+                
+                # In-memory databases live and die with their connection, so they are never pooled
+                if db_path and db_path != ":memory:":
+                    return (source_id, db_path)
+                
+                return None
+        
+        return None
     
     async def _close_file_connection(self, connection: Any) -> None:
         """Close a file connection."""
@@ -619,6 +678,27 @@ class DataManager:
         logger.error("API call queries not implemented")
         return None
     
+    @contextlib.contextmanager
+    def _open_file(
+        self,
+        file_path: Union[str, BinaryIO],
+        mode: str,
+        newline: Optional[str] = None,
+    ) -> Iterator[Any]:
+        """Open a path, or adapt a binary file-like object to the requested mode without closing it."""
+        if isinstance(file_path, (str, os.PathLike)):
+            with open(file_path, mode, newline=newline) as f:
+                yield f
+        elif 'b' in mode:
+            yield file_path
+        else:
+            wrapper = io.TextIOWrapper(file_path, encoding='utf-8', newline=newline)
+            try:
+                yield wrapper
+            finally:
+                # Flush and release the underlying buffer so the caller can keep using it
+                wrapper.detach()
+    
     def _prepare_for_json(self, data: Any) -> Any:
         """Prepare data for JSON serialization by converting Decimal objects to strings."""
         if isinstance(data, dict):
@@ -652,13 +732,15 @@ class DataManager:
             return data
 
 
-# Singleton instance of DataManager
-_data_manager = None
+# Singleton instances of DataManager, one per absolute directory
+@functools.lru_cache(maxsize=None)
+def _get_data_manager(data_dir: str) -> DataManager:
+    return DataManager(data_dir)
 
 
 def get_data_manager(data_dir: Optional[str] = None) -> DataManager:
     """
-    Get the singleton instance of DataManager.
+    Get the singleton instance of DataManager for a directory.
     
     Args:
         data_dir: Directory to store data files (if None, use default)
@@ -666,12 +748,8 @@ def get_data_manager(data_dir: Optional[str] = None) -> DataManager:
     Returns:
         DataManager: Singleton instance of DataManager
     """
-    global _data_manager
-    
-    if _data_manager is None:
-        _data_manager = DataManager(data_dir)
-    
-    return _data_manager
+    data_dir = data_dir or os.path.join(os.path.expanduser("~"), ".eclipsemoon", "data")
+    return _get_data_manager(os.path.abspath(data_dir))
 
 
 # Example usage
@@ -760,8 +838,8 @@ if __name__ == "__main__":
         loaded_data = await data_manager.load_data(csv_path)
         print("Loaded data:", loaded_data)
         
-        # Close connection
-        await data_manager.close_connection("example_db")
+        # Close connections
+        await data_manager.close()
     
     # Run example
     asyncio.run(example())
\ No newline at end of file
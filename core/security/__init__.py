@@ -8,8 +8,8 @@ Author: ECLIPSEMOON
 
 import os
 import base64
-import hashlib
 import hmac
+import functools
 import json
 import logging
 import secrets
@@ -31,6 +31,12 @@ from cryptography.hazmat.primitives.serialization import (
 # Setup logger
 logger = logging.getLogger("core.security")
 
+# Digest used by create_hmac and verify_hmac
+_HMAC_DIGEST = "sha256"
+
+# Default PBKDF2 work factor for hash_password and verify_password
+_PBKDF2_ITERATIONS = 100000
+
 
 class SecurityManager:
     """Manager for security and encryption utilities."""
@@ -391,13 +397,19 @@ class SecurityManager:
             logger.error(f"Error decrypting data: {str(e)}")
             return None
     
-    def hash_password(self, password: str, salt: Optional[bytes] = None) -> Tuple[bytes, bytes]:
+    def hash_password(
+        self,
+        password: str,
+        salt: Optional[bytes] = None,
+        iterations: int = _PBKDF2_ITERATIONS,
+    ) -> Tuple[bytes, bytes]:
         """
         Hash a password using PBKDF2.
         
         Args:
             password: Password to hash
             salt: Salt to use (if None, generate a new one)
+            iterations: Number of PBKDF2 iterations
             
         Returns:
             Tuple[bytes, bytes]: Password hash and salt
@@ -413,7 +425,7 @@ class SecurityManager:
             algorithm=hashes.SHA256(),
             length=32,
             salt=salt,
-            iterations=100000
+            iterations=iterations
         )
         
         # Hash password
@@ -427,6 +439,7 @@ class SecurityManager:
         password: str,
         password_hash: bytes,
         salt: bytes,
+        iterations: int = _PBKDF2_ITERATIONS,
     ) -> bool:
         """
         Verify a password against a hash.
@@ -435,6 +448,7 @@ class SecurityManager:
             password: Password to verify
             password_hash: Hash to verify against
             salt: Salt used for hashing
+            iterations: Number of PBKDF2 iterations used for hashing
             
         Returns:
             bool: True if password is correct, False otherwise
@@ -446,7 +460,7 @@ class SecurityManager:
             algorithm=hashes.SHA256(),
             length=32,
             salt=salt,
-            iterations=100000
+            iterations=iterations
         )
         
         try:
@@ -506,10 +520,10 @@ class SecurityManager:
             key = key.encode('utf-8')
         
         # Create HMAC
-        h = hmac.new(key, data, hashlib.sha256)
+        digest = hmac.digest(key, data, _HMAC_DIGEST)
         
         logger.info("HMAC created successfully")
-        return h.digest()
+        return digest
     
     def verify_hmac(
         self,
@@ -530,23 +544,29 @@ class SecurityManager:
         """
         logger.info("Verifying HMAC")
         
-        # Create HMAC
-        calculated_hmac = self.create_hmac(data, key)
+        # Convert data and key to bytes if they're strings
+        if isinstance(data, str):
+            data = data.encode('utf-8')
+        
+        if isinstance(key, str):
+            key = key.encode('utf-8')
         
-        # Compare HMACs
-        is_valid = hmac.compare_digest(calculated_hmac, hmac_digest)
+        # Compare HMACs in constant time using the one-shot digest
+        is_valid = hmac.compare_digest(hmac.digest(key, data, _HMAC_DIGEST), hmac_digest)
         
         logger.info(f"HMAC verification {'successful' if is_valid else 'failed'}")
         return is_valid
 
 
-# Singleton instance of SecurityManager
-_security_manager = None
+# Singleton instances of SecurityManager, one per absolute directory
+@functools.lru_cache(maxsize=None)
+def _get_security_manager(keys_dir: str) -> SecurityManager:
+    return SecurityManager(keys_dir)
 
 
 def get_security_manager(keys_dir: Optional[str] = None) -> SecurityManager:
     """
-    Get the singleton instance of SecurityManager.
+    Get the singleton instance of SecurityManager for a directory.
     
     Args:
         keys_dir: Directory to store keys (if None, use default)
@@ -554,12 +574,8 @@ def get_security_manager(keys_dir: Optional[str] = None) -> SecurityManager:
     Returns:
         SecurityManager: Singleton instance of SecurityManager
     """
-    global _security_manager
-    
-    if _security_manager is None:
-        _security_manager = SecurityManager(keys_dir)
-    
-    return _security_manager
+    keys_dir = keys_dir or os.path.join(os.path.expanduser("~"), ".eclipsemoon", "keys")
+    return _get_security_manager(os.path.abspath(keys_dir))
 
 
 # Example usage
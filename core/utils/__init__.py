@@ -8,13 +8,22 @@ Author: ECLIPSEMOON
 
 import os
 import sys
+import functools
 import logging
 import json
 import time
 import traceback
-from datetime import datetime, timezone
-from decimal import Decimal
-from typing import Dict, List, Optional, Union, Any, Callable, TypeVar, Generic
+from datetime import date, datetime, timezone
+from decimal import Decimal, InvalidOperation
+from enum import Enum
+from uuid import UUID
+from itertools import islice
+from typing import Dict, List, Optional, Union, Any, Callable, TypeVar, Generic, Iterable, Iterator
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Setup logger
 logger = logging.getLogger("core.utils")
@@ -96,8 +105,9 @@ class Timer:
             name: Name of the timer (for logging)
         """
         self.name = name or "Timer"
-        self.start_time = None
-        self.end_time = None
+        # Monotonic timestamps in integer nanoseconds (time.perf_counter_ns)
+        self.start_time: Optional[int] = None
+        self.end_time: Optional[int] = None
     
     def __enter__(self) -> 'Timer':
         """
@@ -115,7 +125,7 @@ class Timer:
     
     def start(self) -> None:
         """Start the timer."""
-        self.start_time = time.time()
+        self.start_time = time.perf_counter_ns()
         self.end_time = None
     
     def stop(self) -> float:
@@ -128,8 +138,8 @@ class Timer:
         if self.start_time is None:
             raise ValueError("Timer not started")
         
-        self.end_time = time.time()
-        elapsed = self.end_time - self.start_time
+        self.end_time = time.perf_counter_ns()
+        elapsed = (self.end_time - self.start_time) / 1e9
         
         logger.info(f"{self.name}: {elapsed:.6f} seconds")
         
@@ -145,10 +155,8 @@ class Timer:
         if self.start_time is None:
             raise ValueError("Timer not started")
         
-        if self.end_time is None:
-            return time.time() - self.start_time
-        else:
-            return self.end_time - self.start_time
+        end_time = self.end_time if self.end_time is not None else time.perf_counter_ns()
+        return (end_time - self.start_time) / 1e9
 
 
 def setup_logging(
@@ -217,8 +225,27 @@ def retry(
         
     Returns:
         Callable: Decorated function
+        
+    Raises:
+        ValueError: If max_attempts is less than 1
     """
+    if max_attempts < 1:
+        raise ValueError(f"max_attempts must be at least 1, got {max_attempts}")
+    
     def decorator(func: Callable) -> Callable:
+        # A single attempt never sleeps or retries; only the failure log is needed
+        if max_attempts == 1:
+            @functools.wraps(func)
+            def single_attempt(*args, **kwargs):
+                try:
+                    return func(*args, **kwargs)
+                except exceptions as e:
+                    logger.error(f"Failed after {max_attempts} attempts: {str(e)}")
+                    raise
+            
+            return single_attempt
+        
+        @functools.wraps(func)
         def wrapper(*args, **kwargs):
             attempt = 1
             current_delay = delay
@@ -242,6 +269,10 @@ def retry(
     return decorator
 
 
+# Quantization exponents for common format_decimal precisions
+_DECIMAL_QUANTUMS = {p: Decimal(1).scaleb(-p) for p in range(19)}
+
+
 def format_decimal(
     value: Decimal,
     precision: int = 8,
@@ -261,14 +292,19 @@ def format_decimal(
     if not isinstance(value, Decimal):
         value = Decimal(str(value))
     
-    # Format with specified precision
-    formatted = f"{value:.{precision}f}"
+    # Round to the specified precision
+    quantum = _DECIMAL_QUANTUMS.get(precision) or Decimal(1).scaleb(-precision)
+    try:
+        quantized = value.quantize(quantum)
+    except InvalidOperation:
+        # Infinities and results wider than the context precision can't be quantized
+        formatted = f"{value:.{precision}f}"
+        if strip_zeros and '.' in formatted:
+            formatted = formatted.rstrip('0').rstrip('.')
+        return formatted
     
     # Strip trailing zeros if requested
-    if strip_zeros and '.' in formatted:
-        formatted = formatted.rstrip('0').rstrip('.')
-    
-    return formatted
+    return format(quantized.normalize() if strip_zeros else quantized, 'f')
 
 
 def parse_decimal(value: Union[str, int, float, Decimal]) -> Decimal:
@@ -281,12 +317,25 @@ def parse_decimal(value: Union[str, int, float, Decimal]) -> Decimal:
     Returns:
         Decimal: Parsed decimal value
     """
+    # Exact-type checks cover the common cases; Decimal accepts int and str directly
+    value_type = type(value)
+    if value_type is Decimal:
+        return value
+    if value_type is int or value_type is str:
+        return Decimal(value)
+    if value_type is float:
+        return Decimal(repr(value))
+    
     if isinstance(value, Decimal):
         return value
     
     return Decimal(str(value))
 
 
+# UTC tzinfo, bound once to avoid the attribute lookup per conversion
+_UTC = timezone.utc
+
+
 def timestamp_to_datetime(timestamp: int) -> datetime:
     """
     Convert a Unix timestamp to a datetime.
@@ -297,7 +346,7 @@ def timestamp_to_datetime(timestamp: int) -> datetime:
     Returns:
         datetime: Datetime object
     """
-    return datetime.fromtimestamp(timestamp, timezone.utc)
+    return datetime.fromtimestamp(timestamp, _UTC)
 
 
 def datetime_to_timestamp(dt: datetime) -> int:
@@ -344,9 +393,41 @@ def parse_datetime(
     Returns:
         datetime: Parsed datetime object
     """
+    # Fast path: the default format is a subset of ISO 8601, which fromisoformat parses in C.
+    # Only exact "YYYY-MM-DD HH:MM:SS" strings take it; fromisoformat also accepts offsets and
+    # fractions that strptime would reject.
+    if (
+        format_str == "%Y-%m-%d %H:%M:%S"
+        and len(datetime_str) == 19
+        and datetime_str[4] == datetime_str[7] == "-"
+        and datetime_str[10] == " "
+        and datetime_str[13] == datetime_str[16] == ":"
+        and datetime_str[:4].isdigit()
+        and datetime_str[5:7].isdigit()
+        and datetime_str[8:10].isdigit()
+        and datetime_str[11:13].isdigit()
+        and datetime_str[14:16].isdigit()
+        and datetime_str[17:].isdigit()
+    ):
+        try:
+            return datetime.fromisoformat(datetime_str)
+        except ValueError:
+            pass
+    
     return datetime.strptime(datetime_str, format_str)
 
 
+# JSON encoders keyed by exact type, used by json_serialize
+_JSON_ENCODERS: Dict[type, Callable[[Any], Any]] = {
+    Decimal: str,
+    datetime: datetime.isoformat,
+    date: date.isoformat,
+    set: list,
+    frozenset: list,
+    UUID: str,
+}
+
+
 def json_serialize(obj: Any) -> Any:
     """
     Serialize an object to JSON.
@@ -357,24 +438,66 @@ def json_serialize(obj: Any) -> Any:
     Returns:
         Any: JSON-serializable object
     """
+    # Exact-type dispatch for the common cases; subclasses fall through to the checks below
+    encoder = _JSON_ENCODERS.get(type(obj))
+    if encoder is not None:
+        return encoder(obj)
+    
     if isinstance(obj, Decimal):
         return str(obj)
     elif isinstance(obj, datetime):
         return obj.isoformat()
     elif isinstance(obj, set):
         return list(obj)
+    elif isinstance(obj, Enum):
+        return obj.value
     elif hasattr(obj, "to_dict") and callable(getattr(obj, "to_dict")):
         return obj.to_dict()
+    elif hasattr(obj, "tolist") and callable(getattr(obj, "tolist")):
+        # NumPy scalars and arrays, as orjson's OPT_SERIALIZE_NUMPY writes them
+        return obj.tolist()
     elif hasattr(obj, "__dict__"):
         return obj.__dict__
     else:
         return str(obj)
 
 
+def _orjson_unsafe(obj: Any) -> bool:
+    """
+    Check whether orjson would write a value differently from the stdlib encoder.
+    
+    orjson spells float exponents differently ("1e16" vs "1e+16") and writes NaN and
+    infinities as null; floats that are zero or within [1e-4, 1e16) match exactly.
+    """
+    if isinstance(obj, float):
+        return obj != 0.0 and not 1e-4 <= abs(obj) < 1e16
+    elif isinstance(obj, dict):
+        return any(_orjson_unsafe(key) or _orjson_unsafe(value) for key, value in obj.items())
+    elif isinstance(obj, (list, tuple)):
+        return any(_orjson_unsafe(value) for value in obj)
+    elif isinstance(obj, Enum):
+        return _orjson_unsafe(obj.value)
+    else:
+        return False
+
+
+def _orjson_default(obj: Any) -> Any:
+    """orjson default hook that defers to the stdlib encoder for values orjson would change."""
+    value = json_serialize(obj)
+    if _orjson_unsafe(value):
+        raise TypeError("value must be written by the stdlib encoder")
+    return value
+
+
 def to_json(obj: Any, indent: Optional[int] = None) -> str:
     """
     Convert an object to a JSON string.
     
+    The output is the same whichever JSON backend is installed: compact separators
+    (or ": " when indented), unescaped UTF-8 and the stdlib's float spelling. NaN and
+    infinities are written as NaN and Infinity, as json.dumps does, so they survive a
+    round trip through from_json.
+    
     Args:
         obj: Object to convert
         indent: Indentation level (if None, no indentation)
@@ -382,7 +505,19 @@ def to_json(obj: Any, indent: Optional[int] = None) -> str:
     Returns:
         str: JSON string
     """
-    return json.dumps(obj, default=json_serialize, indent=indent)
+    if orjson is not None and indent in (None, 2) and not _orjson_unsafe(obj):
+        option = orjson.OPT_NON_STR_KEYS
+        if indent == 2:
+            option |= orjson.OPT_INDENT_2
+        
+        try:
+            return orjson.dumps(obj, default=_orjson_default, option=option).decode('utf-8')
+        except TypeError:
+            # Values orjson rejects (e.g. integers wider than 64 bits) or would write differently
+            pass
+    
+    separators = (",", ":") if indent is None else (",", ": ")
+    return json.dumps(obj, default=json_serialize, indent=indent, separators=separators, ensure_ascii=False)
 
 
 def from_json(json_str: str) -> Any:
@@ -395,6 +530,8 @@ def from_json(json_str: str) -> Any:
     Returns:
         Any: Parsed object
     """
+    # Always the stdlib parser: orjson rejects NaN, Infinity and lone surrogates, and
+    # rounds integers wider than 64 bits (e.g. token amounts) to float
     return json.loads(json_str)
 
 
@@ -420,10 +557,15 @@ def safe_divide(
     return numerator / denominator
 
 
+# Default suffix used by truncate_string
+_TRUNCATE_SUFFIX = "..."
+_TRUNCATE_SUFFIX_LEN = len(_TRUNCATE_SUFFIX)
+
+
 def truncate_string(
     s: str,
     max_length: int,
-    suffix: str = "...",
+    suffix: Optional[str] = None,
 ) -> str:
     """
     Truncate a string to a maximum length.
@@ -431,7 +573,7 @@ def truncate_string(
     Args:
         s: String to truncate
         max_length: Maximum length
-        suffix: Suffix to add if truncated
+        suffix: Suffix to add if truncated (defaults to "...")
         
     Returns:
         str: Truncated string
@@ -439,6 +581,9 @@ def truncate_string(
     if len(s) <= max_length:
         return s
     
+    if suffix is None:
+        return s[:max_length - _TRUNCATE_SUFFIX_LEN] + _TRUNCATE_SUFFIX
+    
     return s[:max_length - len(suffix)] + suffix
 
 
@@ -465,6 +610,8 @@ def is_valid_json(json_str: str) -> bool:
     Returns:
         bool: True if valid JSON, False otherwise
     """
+    # Validity means "json.loads accepts it": orjson rejects NaN, Infinity, out-of-range
+    # numbers and lone surrogates, so it cannot stand in here
     try:
         json.loads(json_str)
         return True
@@ -499,18 +646,26 @@ def get_environment_variable(
     return value
 
 
-def chunks(lst: List[T], n: int) -> List[List[T]]:
+def chunks(lst: Iterable[T], n: int) -> Union[List[List[T]], Iterator[List[T]]]:
     """
-    Split a list into chunks of size n.
+    Split a list or other iterable into chunks of size n.
+    
+    Sliceable containers (anything with __getitem__ and __len__, including lists,
+    NumPy arrays and pandas Series) are sliced eagerly into a list of chunks; any
+    other iterable is consumed lazily, one chunk at a time.
     
     Args:
-        lst: List to split
+        lst: List or iterable to split
         n: Chunk size
         
     Returns:
-        List[List[T]]: List of chunks
+        Union[List[List[T]], Iterator[List[T]]]: List of chunks for sliceable inputs, iterator of chunks otherwise
     """
-    return [lst[i:i + n] for i in range(0, len(lst), n)]
+    if hasattr(lst, '__getitem__') and hasattr(lst, '__len__'):
+        return [lst[i:i + n] for i in range(0, len(lst), n)]
+    
+    it = iter(lst)
+    return iter(lambda: list(islice(it, n)), [])
 
 
 # Example usage
@@ -0,0 +1,16 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ECLIPSEMOON AI Protocol Framework
+Shared pytest configuration
+Author: ECLIPSEMOON
+"""
+
+import os
+import sys
+
+# Test modules import the project as installed (pip install -e .); fall back to the
+# repository root for plain checkouts, added once per session
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
@@ -7,16 +7,12 @@ Author: ECLIPSEMOON
 """
 
 import os
-import sys
 import unittest
 import asyncio
 import tempfile
 import shutil
 from decimal import Decimal
 
-# Add parent directory to path to import core modules
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
-
 from core.ai import get_model_manager, ModelConfig
 from core.blockchain import get_blockchain_client, DEVNET_CONFIG
 from core.config import get_config_manager
@@ -28,6 +24,12 @@ from core.utils import setup_logging, Timer
 class TestCoreIntegration(unittest.TestCase):
     """Integration tests for core modules."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Set up shared test environment."""
+        # Set up logging once for the whole class
+        setup_logging(log_level="INFO")
+    
     def setUp(self):
         """Set up test environment."""
         # Create temporary test directory
@@ -43,9 +45,6 @@ class TestCoreIntegration(unittest.TestCase):
         os.makedirs(self.keys_dir, exist_ok=True)
         os.makedirs(self.config_dir, exist_ok=True)
         os.makedirs(self.data_dir, exist_ok=True)
-        
-        # Set up logging
-        setup_logging(log_level="INFO")
     
     def tearDown(self):
         """Clean up test environment."""
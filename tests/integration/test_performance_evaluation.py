@@ -7,7 +7,6 @@ Author: ECLIPSEMOON
 """
 
 import os
-import sys
 import unittest
 import asyncio
 import tempfile
@@ -18,9 +17,6 @@ import matplotlib.pyplot as plt
 from decimal import Decimal
 from datetime import datetime, timedelta
 
-# Add parent directory to path to import core modules
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
-
 # Import core modules
 from core.utils import setup_logging, Timer
 
@@ -300,13 +296,16 @@ class StrategyBacktest:
 class TestPerformanceEvaluation(unittest.TestCase):
     """Tests for performance evaluation."""
 
+    @classmethod
+    def setUpClass(cls):
+        """Set up shared test environment."""
+        # Set up logging once for the whole class
+        setup_logging(log_level="INFO")
+    
     def setUp(self):
         """Set up test environment."""
         # Create temporary test directory
         self.test_dir = tempfile.mkdtemp()
-        
-        # Set up logging
-        setup_logging(log_level="INFO")
     
     def tearDown(self):
         """Clean up test environment."""
@@ -7,16 +7,11 @@ Author: ECLIPSEMOON
 """
 
 import os
-import sys
 import unittest
 import asyncio
 import tempfile
-import shutil
 from decimal import Decimal
 
-# Add parent directory to path to import core modules
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
-
 # Import core modules
 from core.config import get_config_manager
 from core.utils import setup_logging
@@ -25,7 +20,28 @@ from core.utils import setup_logging
 # For this test file, we'll mock the protocol modules since they're not fully implemented yet
 
 
-class MockDriftProtocol:
+class MockBatchProtocol:
+    """Mock JSON-RPC 2.0 style batching shared by the mock protocols."""
+    
+    async def batch(self, calls):
+        """
+        Mock executing several calls in a single round trip.
+        
+        Each call is a dict with "id", "method" and "params" keys. Results
+        are returned as {"id": ..., "result": ...} dicts; as with JSON-RPC
+        batches, callers should match responses by id, not by position.
+        """
+        results = await asyncio.gather(
+            *[getattr(self, call["method"])(**call.get("params", {})) for call in calls]
+        )
+        
+        return [
+            {"id": call["id"], "result": result}
+            for call, result in zip(calls, results)
+        ]
+
+
+class MockDriftProtocol(MockBatchProtocol):
     """Mock implementation of Drift protocol for testing."""
     
     def __init__(self, config):
@@ -70,7 +86,7 @@ class MockDriftProtocol:
         }
 
 
-class MockJupiterProtocol:
+class MockJupiterProtocol(MockBatchProtocol):
     """Mock implementation of Jupiter protocol for testing."""
     
     def __init__(self, config):
@@ -101,51 +117,57 @@ class MockJupiterProtocol:
 class TestProtocolIntegration(unittest.TestCase):
     """Integration tests for protocol modules."""
 
-    def setUp(self):
-        """Set up test environment."""
-        # Create temporary test directory
-        self.test_dir = tempfile.mkdtemp()
-        
-        # Set up config directory
-        self.config_dir = os.path.join(self.test_dir, "config")
-        os.makedirs(self.config_dir, exist_ok=True)
-        
+    @classmethod
+    def setUpClass(cls):
+        """Set up shared test environment."""
         # Set up logging
         setup_logging(log_level="INFO")
         
+        # Create one temporary test directory for the whole class; the mock
+        # protocols never mutate their configuration, so it is safe to share
+        cls._tmp = tempfile.TemporaryDirectory()
+        cls.test_dir = cls._tmp.name
+        
+        # Set up config directory
+        cls.config_dir = os.path.join(cls.test_dir, "config")
+        os.makedirs(cls.config_dir, exist_ok=True)
+        
         # Get config manager
-        self.config_manager = get_config_manager(self.config_dir)
+        cls.config_manager = get_config_manager(cls.config_dir)
         
         # Create protocol configurations
-        self.drift_config = {
+        cls.drift_config = {
             "rpc_url": "https://api.devnet.solana.com",
-            "wallet_path": os.path.join(self.test_dir, "wallet.json"),
+            "wallet_path": os.path.join(cls.test_dir, "wallet.json"),
             "default_market": "SOL-PERP",
             "default_vault": "SOL-VAULT",
             "max_slippage": Decimal("0.01"),
             "timeout_seconds": 30
         }
         
-        self.jupiter_config = {
+        cls.jupiter_config = {
             "rpc_url": "https://api.devnet.solana.com",
-            "wallet_path": os.path.join(self.test_dir, "wallet.json"),
+            "wallet_path": os.path.join(cls.test_dir, "wallet.json"),
             "default_slippage": Decimal("0.005"),
             "timeout_seconds": 30
         }
         
         # Save configurations
-        self.config_manager.save_config("drift", self.drift_config)
-        self.config_manager.save_config("jupiter", self.jupiter_config)
-        
+        cls.config_manager.save_config("drift", cls.drift_config)
+        cls.config_manager.save_config("jupiter", cls.jupiter_config)
+    
+    @classmethod
+    def tearDownClass(cls):
+        """Clean up shared test environment."""
+        # Remove test directory
+        cls._tmp.cleanup()
+    
+    def setUp(self):
+        """Set up test environment."""
         # Create protocol instances
         self.drift = MockDriftProtocol(self.drift_config)
         self.jupiter = MockJupiterProtocol(self.jupiter_config)
     
-    def tearDown(self):
-        """Clean up test environment."""
-        # Remove test directory
-        shutil.rmtree(self.test_dir)
-    
     async def async_test_drift_operations(self):
         """Test Drift protocol operations."""
         # Open a perpetual position
@@ -228,19 +250,36 @@ class TestProtocolIntegration(unittest.TestCase):
     
     async def async_test_cross_protocol_operations(self):
         """Test operations across multiple protocols."""
-        # Open a position on Drift
-        open_result = await self.drift.open_perp_position(
-            market="SOL-PERP",
-            size=Decimal("1.0"),
-            side="long"
+        # Open a position on Drift and set take profit on Jupiter, issuing
+        # one batch per protocol and running both batches concurrently
+        drift_responses, jupiter_responses = await asyncio.gather(
+            self.drift.batch([
+                {
+                    "id": "open",
+                    "method": "open_perp_position",
+                    "params": {"market": "SOL-PERP", "size": Decimal("1.0"), "side": "long"}
+                }
+            ]),
+            self.jupiter.batch([
+                {
+                    "id": "take_profit",
+                    "method": "take_profit",
+                    "params": {
+                        "market": "SOL-PERP",
+                        "target_price": Decimal("120.0"),
+                        "size": Decimal("1.0")
+                    }
+                }
+            ])
         )
         
-        # Set take profit on Jupiter
-        take_profit_result = await self.jupiter.take_profit(
-            market="SOL-PERP",
-            target_price=Decimal("120.0"),
-            size=Decimal("1.0")
-        )
+        # Match results by call id
+        results = {
+            response["id"]: response["result"]
+            for response in drift_responses + jupiter_responses
+        }
+        open_result = results["open"]
+        take_profit_result = results["take_profit"]
         
         # Verify results
         self.assertEqual(open_result["market"], take_profit_result["market"])
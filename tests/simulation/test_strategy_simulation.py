@@ -6,24 +6,14 @@ Strategy Simulation Tests
 Author: ECLIPSEMOON
 """
 
-import os
-import sys
 import unittest
 import asyncio
-import tempfile
-import shutil
-import pandas as pd
 import numpy as np
 from decimal import Decimal
 from datetime import datetime, timedelta
 
-# Add parent directory to path to import core modules
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
-
 # Import core modules
-from core.config import get_config_manager
-from core.data import get_data_manager
-from core.utils import setup_logging, Timer
+from core.utils import setup_logging
 
 
 class MockExchange:
@@ -31,10 +21,35 @@ class MockExchange:
     
     def __init__(self, initial_balance=Decimal("10000")):
         """Initialize the mock exchange."""
-        self.balance = initial_balance
+        # Amounts are tracked as floats internally; Decimal is only used at
+        # the boundaries exposed to callers (balance and performance metrics)
+        self.initial_balance = float(initial_balance)
+        self.balance = self.initial_balance
         self.positions = {}
         self.trades = []
-        self.fees = Decimal("0.001")  # 0.1% fee
+        self.fees = 0.001  # 0.1% fee
+        
+        # Structure-of-arrays mirror of the trade history, so performance
+        # metrics can be computed with vectorised reductions
+        self._pnl = np.zeros(1024)
+        self._fee = np.zeros(1024)
+        self._is_close = np.zeros(1024, dtype=bool)
+        self._n = 0
+    
+    def _record_trade(self, trade):
+        """Append a trade to the history and its structure-of-arrays mirror."""
+        self.trades.append(trade)
+        
+        # Double the arrays when full
+        if self._n == len(self._pnl):
+            self._pnl = np.concatenate([self._pnl, np.zeros_like(self._pnl)])
+            self._fee = np.concatenate([self._fee, np.zeros_like(self._fee)])
+            self._is_close = np.concatenate([self._is_close, np.zeros_like(self._is_close)])
+        
+        self._pnl[self._n] = trade.get("pnl", 0.0)
+        self._fee[self._n] = trade["fee"]
+        self._is_close[self._n] = trade["type"] == "close"
+        self._n += 1
     
     async def get_price(self, symbol, timestamp=None):
         """Get price for a symbol at a specific timestamp."""
@@ -45,13 +60,16 @@ class MockExchange:
         
         # Generate a deterministic price based on the timestamp
         price = 100 + 10 * np.sin(timestamp / 86400)  # Daily cycle
-        return Decimal(str(price))
+        return float(price)
     
     async def open_position(self, symbol, size, side, price=None):
         """Open a position."""
         if price is None:
             price = await self.get_price(symbol)
         
+        size = float(size)
+        price = float(price)
+        
         # Calculate cost and fees
         cost = size * price
         fee = cost * self.fees
@@ -78,7 +96,7 @@ class MockExchange:
         }
         
         # Record trade
-        self.trades.append({
+        self._record_trade({
             "type": "open",
             "position_id": position_id,
             "symbol": symbol,
@@ -110,6 +128,8 @@ class MockExchange:
         if price is None:
             price = await self.get_price(symbol)
         
+        price = float(price)
+        
         # Calculate profit/loss and fees
         size = position["size"]
         entry_price = position["entry_price"]
@@ -126,7 +146,7 @@ class MockExchange:
         self.balance += size * price + pnl - fee
         
         # Record trade
-        self.trades.append({
+        self._record_trade({
             "type": "close",
             "position_id": position_id,
             "symbol": symbol,
@@ -150,7 +170,7 @@ class MockExchange:
     
     def get_balance(self):
         """Get current balance."""
-        return self.balance
+        return Decimal(repr(self.balance))
     
     def get_positions(self):
         """Get open positions."""
@@ -162,7 +182,7 @@ class MockExchange:
     
     def calculate_performance(self):
         """Calculate performance metrics."""
-        if not self.trades:
+        if self._n == 0:
             return {
                 "total_trades": 0,
                 "win_rate": 0,
@@ -173,21 +193,26 @@ class MockExchange:
                 "roi": Decimal("0")
             }
         
+        # Slice the populated part of the trade arrays
+        is_close = self._is_close[:self._n]
+        pnl = self._pnl[:self._n][is_close]
+        fees = self._fee[:self._n]
+        
         # Calculate metrics
-        total_trades = len([t for t in self.trades if t["type"] == "close"])
-        winning_trades = len([t for t in self.trades if t["type"] == "close" and t.get("pnl", 0) > 0])
+        total_trades = int(np.count_nonzero(is_close))
+        winning_trades = int(np.count_nonzero(pnl > 0))
         win_rate = winning_trades / total_trades if total_trades > 0 else 0
         
-        total_profit = sum([t.get("pnl", 0) for t in self.trades if t["type"] == "close" and t.get("pnl", 0) > 0])
-        total_loss = sum([abs(t.get("pnl", 0)) for t in self.trades if t["type"] == "close" and t.get("pnl", 0) < 0])
+        total_profit = float(pnl[pnl > 0].sum())
+        total_loss = float(-pnl[pnl < 0].sum())
         profit_factor = total_profit / total_loss if total_loss > 0 else float('inf')
         
-        total_pnl = sum([t.get("pnl", 0) for t in self.trades if t["type"] == "close"])
-        total_fees = sum([t.get("fee", 0) for t in self.trades])
+        # Convert the aggregated scalars back to Decimal once
+        total_pnl = Decimal(repr(float(pnl.sum())))
+        total_fees = Decimal(repr(float(fees.sum())))
         net_pnl = total_pnl - total_fees
         
-        initial_balance = Decimal("10000")  # Assuming this is the initial balance
-        roi = (net_pnl / initial_balance) * 100
+        roi = (net_pnl / Decimal(repr(self.initial_balance))) * 100
         
         return {
             "total_trades": total_trades,
@@ -210,31 +235,39 @@ class SimpleMovingAverageStrategy:
         self.short_period = short_period
         self.long_period = long_period
         self.position_id = None
-        self.prices = []
-        self.timestamps = []
+        
+        # Ring buffer holding only the price history the averages need
+        self.max_period = max(short_period, long_period)
+        self._prices = np.empty(self.max_period, dtype=np.float64)
+        self._count = 0
+    
+    def _moving_average(self, period):
+        """Calculate the mean of the last `period` prices in the ring buffer."""
+        end = self._count % self.max_period
+        start = end - period
+        
+        if start >= 0:
+            return self._prices[start:end].mean()
+        
+        # Window wraps around the end of the buffer
+        return (self._prices[start:].sum() + self._prices[:end].sum()) / period
     
     async def update(self, timestamp):
         """Update the strategy with new data."""
         # Get current price
         price = await self.exchange.get_price(self.symbol, timestamp)
         
-        # Store price and timestamp
-        self.prices.append(float(price))
-        self.timestamps.append(timestamp)
-        
-        # Keep only the necessary history
-        max_period = max(self.short_period, self.long_period)
-        if len(self.prices) > max_period:
-            self.prices = self.prices[-max_period:]
-            self.timestamps = self.timestamps[-max_period:]
+        # Store price, overwriting the oldest entry once the buffer is full
+        self._prices[self._count % self.max_period] = price
+        self._count += 1
         
         # Check if we have enough data
-        if len(self.prices) < max_period:
+        if self._count < self.max_period:
             return
         
         # Calculate moving averages
-        short_ma = sum(self.prices[-self.short_period:]) / self.short_period
-        long_ma = sum(self.prices[-self.long_period:]) / self.long_period
+        short_ma = self._moving_average(self.short_period)
+        long_ma = self._moving_average(self.long_period)
         
         # Trading logic
         if short_ma > long_ma and self.position_id is None:
@@ -263,19 +296,12 @@ class SimpleMovingAverageStrategy:
 class TestStrategySimulation(unittest.TestCase):
     """Tests for strategy simulation."""
 
-    def setUp(self):
-        """Set up test environment."""
-        # Create temporary test directory
-        self.test_dir = tempfile.mkdtemp()
-        
-        # Set up logging
+    @classmethod
+    def setUpClass(cls):
+        """Set up shared test environment."""
+        # Set up logging once for the whole class
         setup_logging(log_level="INFO")
     
-    def tearDown(self):
-        """Clean up test environment."""
-        # Remove test directory
-        shutil.rmtree(self.test_dir)
-    
     async def run_simulation(self, strategy_class, params, days=30, interval_minutes=60):
         """Run a strategy simulation."""
         # Create exchange
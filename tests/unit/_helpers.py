@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ECLIPSEMOON AI Protocol Framework
+Shared Helpers for Unit Tests
+Author: ECLIPSEMOON
+"""
+
+import os
+from typing import Any
+from unittest.mock import AsyncMock
+
+import aiohttp
+
+# Root for test temporary directories: tmpfs when available, otherwise the system default
+TMP_ROOT = "/dev/shm" if os.path.isdir("/dev/shm") else None
+
+
+def make_aiohttp_response(status: int = 200, json_payload: Any = None, text: str = "") -> AsyncMock:
+    """
+    Build a mock aiohttp response usable as an async context manager.
+    
+    Args:
+        status: HTTP status code of the response
+        json_payload: Value returned by ``await response.json()``
+        text: Value returned by ``await response.text()``
+        
+    Returns:
+        AsyncMock: Configured mock response
+    """
+    response = AsyncMock(spec=aiohttp.ClientResponse)
+    response.status = status
+    response.json = AsyncMock(return_value=json_payload)
+    response.text = AsyncMock(return_value=text)
+    response.__aenter__ = AsyncMock(return_value=response)
+    response.__aexit__ = AsyncMock(return_value=None)
+    return response
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ECLIPSEMOON AI Protocol Framework
+Micro-benchmarks for Data Module
+Author: ECLIPSEMOON
+
+Drives the TestDataManager test coroutines directly with pyperf, so timings are not
+dominated by event loop setup. Run from the repository root:
+
+    python -m tests.unit.bench_data -o bench_data.json
+"""
+
+import atexit
+import sys
+
+try:
+    import pyperf
+except ImportError:
+    pyperf = None
+
+from tests.unit.test_data import TestDataManager
+
+# Coroutines that can be re-run on the same test case; the connection tests
+# assert mock call counts and so only hold for a single run.
+BENCHMARKS = [
+    "register_source",
+    "unregister_source",
+    "get_source",
+    "list_sources",
+    "save_load_data",
+]
+
+
+def main() -> None:
+    """Run the data manager benchmarks."""
+    if pyperf is None:
+        sys.exit("pyperf is required to run benchmarks: pip install -e \".[dev]\"")
+    
+    # Workers are spawned as "python <program_args>"; re-run as a module so the tests package imports
+    runner = pyperf.Runner(program_args=("-m", "tests.unit.bench_data"))
+    
+    for name in BENCHMARKS:
+        case = TestDataManager(f"test_{name}")
+        case.setUp()
+        atexit.register(case.tearDown)
+        
+        runner.bench_async_func(f"data_manager.{name}", getattr(case, f"test_{name}"))
+
+
+if __name__ == "__main__":
+    main()
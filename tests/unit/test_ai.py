@@ -7,15 +7,11 @@ Author: ECLIPSEMOON
 """
 
 import os
-import sys
 import unittest
 import asyncio
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, MagicMock, AsyncMock
 from decimal import Decimal
 
-# Add parent directory to path to import core modules
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
-
 from core.ai import ModelManager, ModelConfig, PredictionResult, get_model_manager
 
 
@@ -84,7 +80,7 @@ class TestModelManager(unittest.TestCase):
         # Remove test directory
         os.rmdir(self.test_models_dir)
     
-    @patch('core.ai.ModelManager._load_price_prediction_model')
+    @patch('core.ai.ModelManager._load_price_prediction_model', new_callable=AsyncMock)
     def test_load_model(self, mock_load_model):
         """Test loading a model."""
         # Create test model files
@@ -113,8 +109,7 @@ class TestModelManager(unittest.TestCase):
         
         # Mock the model loading function
         mock_model = {"type": "price_prediction", "weights": [1, 2, 3]}
-        mock_load_model.return_value = asyncio.Future()
-        mock_load_model.return_value.set_result(mock_model)
+        mock_load_model.return_value = mock_model
         
         # Load model
         result = asyncio.run(self.model_manager.load_model(model_id))
@@ -128,6 +123,76 @@ class TestModelManager(unittest.TestCase):
         # Verify mock was called
         mock_load_model.assert_called_once()
     
+    def test_load_model_reuses_cached_config(self):
+        """Test that reloading an unchanged model reuses its parsed configuration."""
+        # Create test model files
+        model_id = "test_model"
+        model_path = os.path.join(self.test_models_dir, f"{model_id}.model")
+        config_path = os.path.join(self.test_models_dir, f"{model_id}.json")
+        
+        with open(model_path, 'w') as f:
+            f.write("Test model data")
+        
+        config = {
+            "model_id": model_id,
+            "model_type": "price_prediction",
+            "version": "1.0.0",
+            "input_features": ["price", "volume"],
+            "output_features": ["predicted_price"]
+        }
+        
+        import json
+        with open(config_path, 'w') as f:
+            json.dump(config, f)
+        
+        # Load, unload and load again
+        self.assertTrue(asyncio.run(self.model_manager.load_model(model_id)))
+        first_config = self.model_manager.configs[model_id]
+        asyncio.run(self.model_manager.unload_model(model_id))
+        self.assertTrue(asyncio.run(self.model_manager.load_model(model_id)))
+        
+        # Verify the cached configuration was reused
+        self.assertIs(self.model_manager.configs[model_id], first_config)
+        
+        # Rewrite the config with a newer mtime and verify it is re-read
+        config["version"] = "2.0.0"
+        with open(config_path, 'w') as f:
+            json.dump(config, f)
+        stat = os.stat(config_path)
+        os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        
+        asyncio.run(self.model_manager.unload_model(model_id))
+        self.assertTrue(asyncio.run(self.model_manager.load_model(model_id)))
+        self.assertEqual(self.model_manager.configs[model_id].version, "2.0.0")
+    
+    def test_load_model_non_finite_hyperparameters(self):
+        """Test loading a model whose config holds an infinite hyperparameter."""
+        # Create test model files
+        model_id = "test_model"
+        model_path = os.path.join(self.test_models_dir, f"{model_id}.model")
+        config_path = os.path.join(self.test_models_dir, f"{model_id}.json")
+        
+        with open(model_path, 'w') as f:
+            f.write("Test model data")
+        
+        config = {
+            "model_id": model_id,
+            "model_type": "price_prediction",
+            "version": "1.0.0",
+            "input_features": ["price", "volume"],
+            "output_features": ["predicted_price"],
+            "hyperparameters": {"max_drawdown": float("inf")}
+        }
+        
+        # json.dump writes the value as Infinity
+        import json
+        with open(config_path, 'w') as f:
+            json.dump(config, f)
+        
+        # Load model
+        self.assertTrue(asyncio.run(self.model_manager.load_model(model_id)))
+        self.assertEqual(self.model_manager.configs[model_id].hyperparameters["max_drawdown"], float("inf"))
+    
     def test_unload_model(self):
         """Test unloading a model."""
         # Add a model to the manager
@@ -149,7 +214,7 @@ class TestModelManager(unittest.TestCase):
         self.assertNotIn(model_id, self.model_manager.models)
         self.assertNotIn(model_id, self.model_manager.configs)
     
-    @patch('core.ai.ModelManager._predict_price')
+    @patch('core.ai.ModelManager._predict_price', new_callable=AsyncMock)
     def test_predict(self, mock_predict):
         """Test making a prediction."""
         # Add a model to the manager
@@ -166,8 +231,7 @@ class TestModelManager(unittest.TestCase):
         # Mock the prediction function
         prediction = {"predicted_price": 105.0}
         confidence = 0.9
-        mock_predict.return_value = asyncio.Future()
-        mock_predict.return_value.set_result((prediction, confidence))
+        mock_predict.return_value = (prediction, confidence)
         
         # Make prediction
         input_data = {"current_price": 100.0, "volume": 1000.0}
@@ -6,118 +6,118 @@ Unit Tests for Blockchain Module
 Author: ECLIPSEMOON
 """
 
-import os
-import sys
-import unittest
 import asyncio
-from unittest.mock import patch, MagicMock
+import unittest
+from unittest.mock import patch, AsyncMock
 from decimal import Decimal
 
-# Add parent directory to path to import core modules
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+import aiohttp
 
+import core.blockchain
 from core.blockchain import (
     NetworkConfig, TransactionConfig, TransactionResult,
-    BlockchainClient, get_blockchain_client,
+    BlockchainClient, get_blockchain_client, get_http_session, close_http_session,
     MAINNET_CONFIG, DEVNET_CONFIG, TESTNET_CONFIG, LOCALNET_CONFIG
 )
+from tests.unit._helpers import make_aiohttp_response
 
-
-class TestNetworkConfig(unittest.TestCase):
-    """Test cases for NetworkConfig class."""
-
-    def test_network_config_creation(self):
-        """Test creating a NetworkConfig instance."""
-        config = NetworkConfig(
-            network_id="test-network",
-            name="Test Network",
-            rpc_url="https://api.test.com",
-            explorer_url="https://explorer.test.com",
-            is_mainnet=False,
-            timeout_seconds=60,
-            max_retries=5,
-            retry_delay_seconds=2
-        )
-        
-        self.assertEqual(config.network_id, "test-network")
-        self.assertEqual(config.name, "Test Network")
-        self.assertEqual(config.rpc_url, "https://api.test.com")
-        self.assertEqual(config.explorer_url, "https://explorer.test.com")
-        self.assertFalse(config.is_mainnet)
-        self.assertEqual(config.timeout_seconds, 60)
-        self.assertEqual(config.max_retries, 5)
-        self.assertEqual(config.retry_delay_seconds, 2)
+# Decimal constants shared across tests
+_DEC_0_01 = Decimal("0.01")
+_DEC_0_001 = Decimal("0.001")
+_DEC_5E_6 = Decimal("0.000005")
+_DEC_1 = Decimal("1")
 
 
-class TestTransactionConfig(unittest.TestCase):
-    """Test cases for TransactionConfig class."""
+def test_network_config_creation():
+    """Test creating a NetworkConfig instance."""
+    config = NetworkConfig(
+        network_id="test-network",
+        name="Test Network",
+        rpc_url="https://api.test.com",
+        explorer_url="https://explorer.test.com",
+        is_mainnet=False,
+        timeout_seconds=60,
+        max_retries=5,
+        retry_delay_seconds=2
+    )
+    
+    assert config.network_id == "test-network"
+    assert config.name == "Test Network"
+    assert config.rpc_url == "https://api.test.com"
+    assert config.explorer_url == "https://explorer.test.com"
+    assert not config.is_mainnet
+    assert config.timeout_seconds == 60
+    assert config.max_retries == 5
+    assert config.retry_delay_seconds == 2
 
-    def test_transaction_config_creation(self):
-        """Test creating a TransactionConfig instance."""
-        config = TransactionConfig(
-            max_fee=Decimal("0.01"),
-            priority_fee=Decimal("0.001"),
-            timeout_seconds=120,
-            skip_preflight=True,
-            max_retries=3,
-            retry_delay_seconds=5
-        )
-        
-        self.assertEqual(config.max_fee, Decimal("0.01"))
-        self.assertEqual(config.priority_fee, Decimal("0.001"))
-        self.assertEqual(config.timeout_seconds, 120)
-        self.assertTrue(config.skip_preflight)
-        self.assertEqual(config.max_retries, 3)
-        self.assertEqual(config.retry_delay_seconds, 5)
 
+def test_transaction_config_creation():
+    """Test creating a TransactionConfig instance."""
+    config = TransactionConfig(
+        max_fee=_DEC_0_01,
+        priority_fee=_DEC_0_001,
+        timeout_seconds=120,
+        skip_preflight=True,
+        max_retries=3,
+        retry_delay_seconds=5
+    )
+    
+    assert config.max_fee == _DEC_0_01
+    assert config.priority_fee == _DEC_0_001
+    assert config.timeout_seconds == 120
+    assert config.skip_preflight
+    assert config.max_retries == 3
+    assert config.retry_delay_seconds == 5
 
-class TestTransactionResult(unittest.TestCase):
-    """Test cases for TransactionResult class."""
 
-    def test_transaction_result_creation(self):
-        """Test creating a TransactionResult instance."""
-        result = TransactionResult(
-            transaction_id="tx123",
-            status="confirmed",
-            block_hash="block456",
-            block_time=1620000000,
-            fee=Decimal("0.000005"),
-            error=None
-        )
-        
-        self.assertEqual(result.transaction_id, "tx123")
-        self.assertEqual(result.status, "confirmed")
-        self.assertEqual(result.block_hash, "block456")
-        self.assertEqual(result.block_time, 1620000000)
-        self.assertEqual(result.fee, Decimal("0.000005"))
-        self.assertIsNone(result.error)
+def test_transaction_result_creation():
+    """Test creating a TransactionResult instance."""
+    result = TransactionResult(
+        transaction_id="tx123",
+        status="confirmed",
+        block_hash="block456",
+        block_time=1620000000,
+        fee=_DEC_5E_6,
+        error=None
+    )
+    
+    assert result.transaction_id == "tx123"
+    assert result.status == "confirmed"
+    assert result.block_hash == "block456"
+    assert result.block_time == 1620000000
+    assert result.fee == _DEC_5E_6
+    assert result.error is None
 
 
-class TestBlockchainClient(unittest.TestCase):
+class TestBlockchainClient(unittest.IsolatedAsyncioTestCase):
     """Test cases for BlockchainClient class."""
 
-    def setUp(self):
-        """Set up test environment."""
-        self.network_config = NetworkConfig(
+    @classmethod
+    def setUpClass(cls):
+        """Set up shared test environment."""
+        cls.network_config = NetworkConfig(
             network_id="test-network",
             name="Test Network",
             rpc_url="https://api.test.com",
             explorer_url="https://explorer.test.com"
         )
         
-        self.client = BlockchainClient(self.network_config)
+        cls.client = BlockchainClient(cls.network_config)
+    
+    def setUp(self):
+        """Set up test environment."""
+        # Reset the only state tests mutate on the shared client
+        self.client.session = None
     
-    @patch('aiohttp.ClientSession.post')
-    async def async_test_connect(self, mock_post):
+    async def asyncTearDown(self):
+        """Clean up test environment."""
+        await close_http_session()
+    
+    @patch.object(aiohttp.ClientSession, 'post')
+    async def test_connect(self, mock_post):
         """Test connecting to the blockchain network."""
         # Mock response
-        mock_response = MagicMock()
-        mock_response.status = 200
-        mock_response.__aenter__.return_value = mock_response
-        mock_response.json.return_value = asyncio.Future()
-        mock_response.json.return_value.set_result({"result": "ok"})
-        
-        mock_post.return_value = mock_response
+        mock_post.return_value = make_aiohttp_response(200, {"result": "ok"})
         
         # Connect to network
         result = await self.client.connect()
@@ -127,38 +127,47 @@ class TestBlockchainClient(unittest.TestCase):
         self.assertIsNotNone(self.client.session)
         
         # Verify mock was called
-        mock_post.assert_called_once()
+        self.assertEqual(mock_post.call_count, 1)
     
-    def test_connect(self):
-        """Test connecting to the blockchain network."""
-        asyncio.run(self.async_test_connect())
-    
-    @patch('aiohttp.ClientSession.close')
-    async def async_test_disconnect(self, mock_close):
+    @patch.object(BlockchainClient, '_send_rpc_request', new_callable=AsyncMock)
+    async def test_disconnect(self, mock_send_request):
         """Test disconnecting from the blockchain network."""
-        # Create session
-        self.client.session = MagicMock()
-        
-        # Mock close method
-        mock_close.return_value = asyncio.Future()
-        mock_close.return_value.set_result(None)
+        # Mock health check response
+        mock_send_request.return_value = {"result": "ok"}
         
-        # Disconnect from network
-        result = await self.client.disconnect()
+        # Connect two clients through the shared session
+        other = BlockchainClient(DEVNET_CONFIG)
+        self.assertTrue(await self.client.connect())
+        self.assertTrue(await other.connect())
+        session = self.client.session
         
-        # Verify results
-        self.assertTrue(result)
+        # Disconnecting one client leaves the session open for the other
+        self.assertTrue(await self.client.disconnect())
         self.assertIsNone(self.client.session)
+        self.assertFalse(session.closed)
         
-        # Verify mock was called
-        mock_close.assert_called_once()
+        # Disconnecting the last client closes the session
+        self.assertTrue(await other.disconnect())
+        self.assertTrue(session.closed)
     
-    def test_disconnect(self):
-        """Test disconnecting from the blockchain network."""
-        asyncio.run(self.async_test_disconnect())
+    @patch.object(BlockchainClient, '_send_rpc_request', new_callable=AsyncMock)
+    async def test_session_is_reused(self, mock_send_request):
+        """Test that clients share a single HTTP session."""
+        # Mock health check response
+        mock_send_request.return_value = {"result": "ok"}
+        
+        # Connect two independent clients
+        client1 = BlockchainClient(DEVNET_CONFIG)
+        client2 = BlockchainClient(TESTNET_CONFIG)
+        self.assertTrue(await client1.connect())
+        self.assertTrue(await client2.connect())
+        
+        # Verify results
+        self.assertIs(client1.session, client2.session)
+        self.assertIs(await get_http_session(), client1.session)
     
-    @patch('core.blockchain.BlockchainClient._send_rpc_request')
-    async def async_test_get_balance(self, mock_send_request):
+    @patch.object(BlockchainClient, '_send_rpc_request', new_callable=AsyncMock)
+    async def test_get_balance(self, mock_send_request):
         """Test getting balance."""
         # Mock response
         mock_response = {
@@ -166,25 +175,21 @@ class TestBlockchainClient(unittest.TestCase):
                 "value": 1000000000  # 1 SOL in lamports
             }
         }
-        mock_send_request.return_value = asyncio.Future()
-        mock_send_request.return_value.set_result(mock_response)
+        mock_send_request.return_value = mock_response
         
         # Get balance
         address = "test_address"
         balance = await self.client.get_balance(address)
         
         # Verify results
-        self.assertEqual(balance, Decimal("1"))  # 1 SOL
+        self.assertEqual(balance, _DEC_1)  # 1 SOL
         
         # Verify mock was called
-        mock_send_request.assert_called_once_with("getBalance", [address])
-    
-    def test_get_balance(self):
-        """Test getting balance."""
-        asyncio.run(self.async_test_get_balance())
+        self.assertEqual(mock_send_request.call_count, 1)
+        self.assertEqual(mock_send_request.call_args.args, ("getBalance", [address]))
     
-    @patch('core.blockchain.BlockchainClient._send_rpc_request')
-    async def async_test_get_transaction(self, mock_send_request):
+    @patch.object(BlockchainClient, '_send_rpc_request', new_callable=AsyncMock)
+    async def test_get_transaction(self, mock_send_request):
         """Test getting transaction details."""
         # Mock response
         mock_response = {
@@ -197,8 +202,7 @@ class TestBlockchainClient(unittest.TestCase):
                 }
             }
         }
-        mock_send_request.return_value = asyncio.Future()
-        mock_send_request.return_value.set_result(mock_response)
+        mock_send_request.return_value = mock_response
         
         # Get transaction
         tx_id = "tx123"
@@ -208,26 +212,20 @@ class TestBlockchainClient(unittest.TestCase):
         self.assertEqual(tx_details, mock_response["result"])
         
         # Verify mock was called
-        mock_send_request.assert_called_once()
+        self.assertEqual(mock_send_request.call_count, 1)
     
-    def test_get_transaction(self):
-        """Test getting transaction details."""
-        asyncio.run(self.async_test_get_transaction())
-    
-    @patch('core.blockchain.BlockchainClient._send_rpc_request')
-    @patch('core.blockchain.BlockchainClient._wait_for_confirmation')
-    @patch('core.blockchain.BlockchainClient.get_transaction')
-    async def async_test_send_transaction(self, mock_get_tx, mock_wait, mock_send_request):
+    @patch.object(BlockchainClient, '_send_rpc_request', new_callable=AsyncMock)
+    @patch.object(BlockchainClient, '_wait_for_confirmation', new_callable=AsyncMock)
+    @patch.object(BlockchainClient, 'get_transaction', new_callable=AsyncMock)
+    async def test_send_transaction(self, mock_get_tx, mock_wait, mock_send_request):
         """Test sending a transaction."""
         # Mock responses
         mock_send_response = {
             "result": "tx123"
         }
-        mock_send_request.return_value = asyncio.Future()
-        mock_send_request.return_value.set_result(mock_send_response)
+        mock_send_request.return_value = mock_send_response
         
-        mock_wait.return_value = asyncio.Future()
-        mock_wait.return_value.set_result(True)
+        mock_wait.return_value = True
         
         mock_tx_details = {
             "blockhash": "block456",
@@ -236,8 +234,7 @@ class TestBlockchainClient(unittest.TestCase):
                 "fee": 5000
             }
         }
-        mock_get_tx.return_value = asyncio.Future()
-        mock_get_tx.return_value.set_result(mock_tx_details)
+        mock_get_tx.return_value = mock_tx_details
         
         # Send transaction
         tx_data = "base64_encoded_transaction"
@@ -250,49 +247,34 @@ class TestBlockchainClient(unittest.TestCase):
         self.assertEqual(result.status, "confirmed")
         self.assertEqual(result.block_hash, "block456")
         self.assertEqual(result.block_time, 1620000000)
-        self.assertEqual(result.fee, Decimal("0.000005"))  # 5000 lamports
+        self.assertEqual(result.fee, _DEC_5E_6)  # 5000 lamports
         
         # Verify mocks were called
-        mock_send_request.assert_called_once()
-        mock_wait.assert_called_once()
-        mock_get_tx.assert_called_once()
-    
-    def test_send_transaction(self):
-        """Test sending a transaction."""
-        asyncio.run(self.async_test_send_transaction())
+        self.assertEqual(mock_send_request.call_count, 1)
+        self.assertEqual(mock_wait.call_count, 1)
+        self.assertEqual(mock_get_tx.call_count, 1)
     
     def test_network_configs(self):
         """Test predefined network configurations."""
-        # Test mainnet config
-        self.assertEqual(MAINNET_CONFIG.network_id, "mainnet-beta")
-        self.assertEqual(MAINNET_CONFIG.name, "Solana Mainnet")
-        self.assertEqual(MAINNET_CONFIG.rpc_url, "https://api.mainnet-beta.solana.com")
-        self.assertTrue(MAINNET_CONFIG.is_mainnet)
-        
-        # Test devnet config
-        self.assertEqual(DEVNET_CONFIG.network_id, "devnet")
-        self.assertEqual(DEVNET_CONFIG.name, "Solana Devnet")
-        self.assertEqual(DEVNET_CONFIG.rpc_url, "https://api.devnet.solana.com")
-        self.assertFalse(DEVNET_CONFIG.is_mainnet)
+        cases = [
+            (MAINNET_CONFIG, "mainnet-beta", "Solana Mainnet", "https://api.mainnet-beta.solana.com", True),
+            (DEVNET_CONFIG, "devnet", "Solana Devnet", "https://api.devnet.solana.com", False),
+            (TESTNET_CONFIG, "testnet", "Solana Testnet", "https://api.testnet.solana.com", False),
+            (LOCALNET_CONFIG, "localnet", "Solana Localnet", "http://localhost:8899", False),
+        ]
         
-        # Test testnet config
-        self.assertEqual(TESTNET_CONFIG.network_id, "testnet")
-        self.assertEqual(TESTNET_CONFIG.name, "Solana Testnet")
-        self.assertEqual(TESTNET_CONFIG.rpc_url, "https://api.testnet.solana.com")
-        self.assertFalse(TESTNET_CONFIG.is_mainnet)
-        
-        # Test localnet config
-        self.assertEqual(LOCALNET_CONFIG.network_id, "localnet")
-        self.assertEqual(LOCALNET_CONFIG.name, "Solana Localnet")
-        self.assertEqual(LOCALNET_CONFIG.rpc_url, "http://localhost:8899")
-        self.assertFalse(LOCALNET_CONFIG.is_mainnet)
+        for config, network_id, name, rpc_url, is_mainnet in cases:
+            with self.subTest(network_id=network_id):
+                self.assertEqual(config.network_id, network_id)
+                self.assertEqual(config.name, name)
+                self.assertEqual(config.rpc_url, rpc_url)
+                self.assertEqual(config.is_mainnet, is_mainnet)
     
-    @patch('core.blockchain.BlockchainClient.connect')
-    async def async_test_get_blockchain_client(self, mock_connect):
+    @patch.object(BlockchainClient, 'connect', new_callable=AsyncMock)
+    async def test_get_blockchain_client(self, mock_connect):
         """Test getting a blockchain client."""
         # Mock connect method
-        mock_connect.return_value = asyncio.Future()
-        mock_connect.return_value.set_result(True)
+        mock_connect.return_value = True
         
         # Get client
         client = await get_blockchain_client("devnet")
@@ -302,11 +284,48 @@ class TestBlockchainClient(unittest.TestCase):
         self.assertEqual(client.network_config.network_id, "devnet")
         
         # Verify mock was called
-        mock_connect.assert_called_once()
+        self.assertEqual(mock_connect.call_count, 1)
+
+
+class TestHttpSession(unittest.TestCase):
+    """Test cases for the shared HTTP session across event loops."""
+
+    def test_session_replaced_on_loop_change(self):
+        """Test that a session from a previous event loop is closed and replaced."""
+        first = asyncio.run(get_http_session())
+        second = asyncio.run(get_http_session())
+        self.addCleanup(asyncio.run, close_http_session())
+        
+        # Verify the stale session was closed rather than leaked
+        self.assertIsNot(first, second)
+        self.assertTrue(first.closed)
+        self.assertFalse(second.closed)
     
-    def test_get_blockchain_client(self):
-        """Test getting a blockchain client."""
-        asyncio.run(self.async_test_get_blockchain_client())
+    @patch.object(BlockchainClient, '_send_rpc_request', new_callable=AsyncMock)
+    def test_disconnect_after_loop_change(self, mock_send_request):
+        """Test that clients from a previous event loop do not keep the new session open."""
+        # Mock health check response
+        mock_send_request.return_value = {"result": "ok"}
+        
+        # Connect a client under one event loop and keep it alive
+        client_a = BlockchainClient(DEVNET_CONFIG)
+        self.assertTrue(asyncio.run(client_a.connect()))
+        
+        # Connect and disconnect another client under a new event loop
+        client_b = BlockchainClient(TESTNET_CONFIG)
+        
+        async def connect_and_disconnect():
+            self.assertTrue(await client_b.connect())
+            session = client_b.session
+            self.assertTrue(await client_b.disconnect())
+            return session
+        
+        session = asyncio.run(connect_and_disconnect())
+        self.addCleanup(asyncio.run, close_http_session())
+        
+        # Verify the last client of the new loop closed its session
+        self.assertTrue(session.closed)
+        self.assertEqual(len(core.blockchain._session_clients), 0)
 
 
 if __name__ == '__main__':
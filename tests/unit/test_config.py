@@ -7,15 +7,14 @@ Author: ECLIPSEMOON
 """
 
 import os
-import sys
+import math
 import unittest
 import json
+import copy
 import tempfile
-import shutil
 from decimal import Decimal
-
-# Add parent directory to path to import core modules
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+from pathlib import Path
+from unittest.mock import patch
 
 from core.config import ConfigManager, get_config_manager
 
@@ -23,34 +22,46 @@ from core.config import ConfigManager, get_config_manager
 class TestConfigManager(unittest.TestCase):
     """Test cases for ConfigManager class."""
 
+    # Sample config (shared; tests that mutate configs must copy it first)
+    sample_config = {
+        "api": {
+            "url": "https://api.example.com",
+            "timeout": 30
+        },
+        "database": {
+            "host": "localhost",
+            "port": 5432
+        },
+        "limits": {
+            "max_connections": 100,
+            "rate_limit": Decimal("10.5")
+        }
+    }
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up shared test environment."""
+        # Create one temporary directory for the whole class
+        cls._tmp = tempfile.TemporaryDirectory()
+        
+        # Expected on-disk form of the sample config, encoded once
+        cls._sample_bytes = json.dumps(cls.sample_config, indent=2, default=str, ensure_ascii=False).encode('utf-8')
+    
+    @classmethod
+    def tearDownClass(cls):
+        """Clean up shared test environment."""
+        # Remove the class directory and every per-test subdirectory
+        cls._tmp.cleanup()
+    
     def setUp(self):
         """Set up test environment."""
-        # Create a temporary directory for configs
-        self.test_config_dir = tempfile.mkdtemp()
+        # Create a per-test directory for configs
+        self.cfg_dir = Path(self._tmp.name) / self.id()
+        self.cfg_dir.mkdir()
+        self.test_config_dir = str(self.cfg_dir)
         
         # Create config manager
         self.config_manager = ConfigManager(self.test_config_dir)
-        
-        # Sample config
-        self.sample_config = {
-            "api": {
-                "url": "https://api.example.com",
-                "timeout": 30
-            },
-            "database": {
-                "host": "localhost",
-                "port": 5432
-            },
-            "limits": {
-                "max_connections": 100,
-                "rate_limit": Decimal("10.5")
-            }
-        }
-    
-    def tearDown(self):
-        """Clean up test environment."""
-        # Remove test directory
-        shutil.rmtree(self.test_config_dir)
     
     def test_save_and_load_config(self):
         """Test saving and loading a configuration."""
@@ -59,8 +70,7 @@ class TestConfigManager(unittest.TestCase):
         self.assertTrue(result)
         
         # Check if file was created
-        config_path = os.path.join(self.test_config_dir, "test.json")
-        self.assertTrue(os.path.exists(config_path))
+        self.assertTrue((self.cfg_dir / "test.json").exists())
         
         # Load config
         loaded_config = self.config_manager.load_config("test")
@@ -73,6 +83,39 @@ class TestConfigManager(unittest.TestCase):
         self.assertEqual(loaded_config["limits"]["max_connections"], self.sample_config["limits"]["max_connections"])
         self.assertEqual(loaded_config["limits"]["rate_limit"], self.sample_config["limits"]["rate_limit"])
     
+    def test_save_config_key_and_text_handling(self):
+        """Test saving configs with non-string keys and non-ASCII text."""
+        config = {1: "one", "name": "café"}
+        
+        # Save config, individually and in bulk
+        self.assertTrue(self.config_manager.save_config("test", config))
+        self.assertTrue(self.config_manager.save_configs_bulk({"bulk": config}))
+        
+        # Verify keys are stringified and text is written as UTF-8
+        expected = json.dumps(config, indent=2, ensure_ascii=False).encode('utf-8')
+        for name in ("test", "bulk"):
+            with self.subTest(name=name):
+                self.assertEqual((self.cfg_dir / f"{name}.json").read_bytes(), expected)
+    
+    def test_save_and_load_wide_numbers(self):
+        """Test configs with integers wider than 64 bits and non-finite floats."""
+        config = {"amount_wei": 10 ** 21, "ratio": float("nan"), "cap": float("inf")}
+        
+        # Save config and load it back from disk
+        self.assertTrue(self.config_manager.save_config("test", config))
+        loaded_config = ConfigManager(self.test_config_dir).load_config("test")
+        
+        # Verify values survive the round trip
+        self.assertEqual(loaded_config["amount_wei"], 10 ** 21)
+        self.assertTrue(math.isnan(loaded_config["ratio"]))
+        self.assertEqual(loaded_config["cap"], float("inf"))
+        
+        # Files written by the stdlib load the same way
+        (self.cfg_dir / "stdlib.json").write_text(json.dumps(config))
+        loaded_config = self.config_manager.load_config("stdlib")
+        self.assertEqual(loaded_config["amount_wei"], 10 ** 21)
+        self.assertTrue(math.isnan(loaded_config["ratio"]))
+    
     def test_get_config(self):
         """Test getting a configuration."""
         # Save config
@@ -93,8 +136,8 @@ class TestConfigManager(unittest.TestCase):
     
     def test_update_config(self):
         """Test updating a configuration."""
-        # Save config
-        self.config_manager.save_config("test", self.sample_config)
+        # Save config (update_config modifies the stored dict in place)
+        self.config_manager.save_config("test", copy.deepcopy(self.sample_config))
         
         # Update config
         updates = {
@@ -131,8 +174,7 @@ class TestConfigManager(unittest.TestCase):
         self.assertTrue(result)
         
         # Check if file was deleted
-        config_path = os.path.join(self.test_config_dir, "test.json")
-        self.assertFalse(os.path.exists(config_path))
+        self.assertFalse((self.cfg_dir / "test.json").exists())
         
         # Verify config was removed from memory
         self.assertNotIn("test", self.config_manager.configs)
@@ -140,9 +182,17 @@ class TestConfigManager(unittest.TestCase):
     def test_list_configs(self):
         """Test listing configurations."""
         # Save multiple configs
-        self.config_manager.save_config("test1", self.sample_config)
-        self.config_manager.save_config("test2", self.sample_config)
-        self.config_manager.save_config("test3", self.sample_config)
+        result = self.config_manager.save_configs_bulk({
+            "test1": self.sample_config,
+            "test2": self.sample_config,
+            "test3": self.sample_config
+        })
+        self.assertTrue(result)
+        
+        # Check if files were created
+        paths = [self.cfg_dir / f"test{i}.json" for i in (1, 2, 3)]
+        for path in paths:
+            self.assertTrue(path.exists())
         
         # List configs
         configs = self.config_manager.list_configs()
@@ -165,10 +215,8 @@ class TestConfigManager(unittest.TestCase):
             self.assertTrue(result)
             
             # Verify exported file
-            with open(temp_path, 'r') as f:
-                exported_config = json.load(f)
-            
-            self.assertEqual(exported_config["api"]["url"], self.sample_config["api"]["url"])
+            with open(temp_path, 'rb') as f:
+                self.assertEqual(f.read(), self._sample_bytes)
             
             # Import config
             result = self.config_manager.import_config(temp_path, "imported")
@@ -176,12 +224,11 @@ class TestConfigManager(unittest.TestCase):
             
             # Verify imported config
             imported_config = self.config_manager.get_config("imported")
-            self.assertEqual(imported_config["api"]["url"], self.sample_config["api"]["url"])
+            self.assertEqual(imported_config, self.sample_config)
         
         finally:
             # Clean up
-            if os.path.exists(temp_path):
-                os.unlink(temp_path)
+            Path(temp_path).unlink(missing_ok=True)
     
     def test_get_config_manager(self):
         """Test getting the singleton config manager."""
@@ -191,7 +238,28 @@ class TestConfigManager(unittest.TestCase):
         
         # Verify it's the same instance
         self.assertIs(manager1, manager2)
-
+    
+    def test_get_config_manager_is_cached(self):
+        """Test that every way of naming a directory shares one cached instance."""
+        with patch("core.config.ConfigManager", wraps=ConfigManager) as manager_cls:
+            manager = get_config_manager(self.test_config_dir)
+            
+            # Look up the cached instance repeatedly and through equivalent paths
+            for _ in range(100):
+                self.assertIs(get_config_manager(self.test_config_dir), manager)
+            self.assertIs(get_config_manager(config_dir=self.test_config_dir), manager)
+            self.assertIs(get_config_manager(self.test_config_dir + "/"), manager)
+        
+        # Verify only one manager was constructed
+        self.assertEqual(manager_cls.call_count, 1)
+    
+    def test_get_config_manager_default_dir(self):
+        """Test that the default directory resolves to one instance however it is requested."""
+        with patch.dict(os.environ, {"HOME": str(self.cfg_dir)}):
+            manager = get_config_manager()
+            self.assertIs(get_config_manager(None), manager)
+            self.assertIs(get_config_manager(config_dir=None), manager)
+            self.assertEqual(manager.config_dir, str(self.cfg_dir / ".eclipsemoon" / "config"))
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -6,21 +6,15 @@ Unit Tests for Data Module
 Author: ECLIPSEMOON
 """
 
+import io
 import os
-import sys
+import sqlite3
 import unittest
-import asyncio
 import tempfile
-import shutil
-import sqlite3
-from unittest.mock import patch, MagicMock
-import pandas as pd
-from decimal import Decimal
-
-# Add parent directory to path to import core modules
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '../..')))
+from unittest.mock import MagicMock, AsyncMock, patch
 
 from core.data import DataManager, DataSource, DataQuery, DataResult, get_data_manager
+from tests.unit._helpers import TMP_ROOT
 
 
 class TestDataSource(unittest.TestCase):
@@ -28,25 +22,22 @@ class TestDataSource(unittest.TestCase):
 
     def test_data_source_creation(self):
         """Test creating a DataSource instance."""
-        source = DataSource(
-            source_id="test_source",
-            name="Test Source",
-            type="database",
-            connection_info={
+        expected = {
+            "source_id": "test_source",
+            "name": "Test Source",
+            "type": "database",
+            "connection_info": {
                 "type": "sqlite",
                 "path": ":memory:"
             },
-            metadata={
+            "metadata": {
                 "description": "Test database source"
             }
-        )
+        }
         
-        self.assertEqual(source.source_id, "test_source")
-        self.assertEqual(source.name, "Test Source")
-        self.assertEqual(source.type, "database")
-        self.assertEqual(source.connection_info["type"], "sqlite")
-        self.assertEqual(source.connection_info["path"], ":memory:")
-        self.assertEqual(source.metadata["description"], "Test database source")
+        source = DataSource(**expected)
+        
+        self.assertEqual({k: getattr(source, k) for k in expected}, expected)
 
 
 class TestDataQuery(unittest.TestCase):
@@ -54,25 +45,22 @@ class TestDataQuery(unittest.TestCase):
 
     def test_data_query_creation(self):
         """Test creating a DataQuery instance."""
-        query = DataQuery(
-            query_id="test_query",
-            source_id="test_source",
-            query_type="sql",
-            query_params={
+        expected = {
+            "query_id": "test_query",
+            "source_id": "test_source",
+            "query_type": "sql",
+            "query_params": {
                 "query": "SELECT * FROM test",
                 "params": []
             },
-            metadata={
+            "metadata": {
                 "description": "Test SQL query"
             }
-        )
+        }
         
-        self.assertEqual(query.query_id, "test_query")
-        self.assertEqual(query.source_id, "test_source")
-        self.assertEqual(query.query_type, "sql")
-        self.assertEqual(query.query_params["query"], "SELECT * FROM test")
-        self.assertEqual(query.query_params["params"], [])
-        self.assertEqual(query.metadata["description"], "Test SQL query")
+        query = DataQuery(**expected)
+        
+        self.assertEqual({k: getattr(query, k) for k in expected}, expected)
 
 
 class TestDataResult(unittest.TestCase):
@@ -80,41 +68,44 @@ class TestDataResult(unittest.TestCase):
 
     def test_data_result_creation(self):
         """Test creating a DataResult instance."""
-        result = DataResult(
-            query_id="test_query",
-            source_id="test_source",
-            timestamp=1620000000,
-            data=[{"id": 1, "name": "Test"}],
-            metadata={
+        expected = {
+            "query_id": "test_query",
+            "source_id": "test_source",
+            "timestamp": 1620000000,
+            "data": [{"id": 1, "name": "Test"}],
+            "metadata": {
                 "row_count": 1
             }
-        )
+        }
         
-        self.assertEqual(result.query_id, "test_query")
-        self.assertEqual(result.source_id, "test_source")
-        self.assertEqual(result.timestamp, 1620000000)
-        self.assertEqual(result.data[0]["id"], 1)
-        self.assertEqual(result.data[0]["name"], "Test")
-        self.assertEqual(result.metadata["row_count"], 1)
+        result = DataResult(**expected)
+        
+        self.assertEqual({k: getattr(result, k) for k in expected}, expected)
 
 
-class TestDataManager(unittest.TestCase):
+class TestDataManager(unittest.IsolatedAsyncioTestCase):
     """Test cases for DataManager class."""
 
     def setUp(self):
         """Set up test environment."""
         # Create a temporary directory for data
-        self.test_data_dir = tempfile.mkdtemp()
+        self._tmp = tempfile.TemporaryDirectory(dir=TMP_ROOT)
+        self.test_data_dir = self._tmp.name
         
         # Create data manager
         self.data_manager = DataManager(self.test_data_dir)
+        
+        # Stub out database internals on the instance; the manager is discarded after each test
+        self.data_manager._connect_database = AsyncMock()
+        self.data_manager._close_database_connection = AsyncMock()
+        self.data_manager._execute_sql_query = AsyncMock()
     
     def tearDown(self):
         """Clean up test environment."""
         # Remove test directory
-        shutil.rmtree(self.test_data_dir)
+        self._tmp.cleanup()
     
-    async def async_test_register_source(self):
+    async def test_register_source(self):
         """Test registering a data source."""
         # Create source
         source = DataSource(
@@ -138,11 +129,7 @@ class TestDataManager(unittest.TestCase):
         sources_file = os.path.join(self.test_data_dir, "sources.json")
         self.assertTrue(os.path.exists(sources_file))
     
-    def test_register_source(self):
-        """Test registering a data source."""
-        asyncio.run(self.async_test_register_source())
-    
-    async def async_test_unregister_source(self):
+    async def test_unregister_source(self):
         """Test unregistering a data source."""
         # Register source
         source = DataSource(
@@ -164,11 +151,7 @@ class TestDataManager(unittest.TestCase):
         self.assertTrue(result)
         self.assertNotIn("test_source", self.data_manager.sources)
     
-    def test_unregister_source(self):
-        """Test unregistering a data source."""
-        asyncio.run(self.async_test_unregister_source())
-    
-    async def async_test_get_source(self):
+    async def test_get_source(self):
         """Test getting a data source."""
         # Register source
         source = DataSource(
@@ -191,11 +174,7 @@ class TestDataManager(unittest.TestCase):
         self.assertEqual(retrieved_source.source_id, "test_source")
         self.assertEqual(retrieved_source.name, "Test Source")
     
-    def test_get_source(self):
-        """Test getting a data source."""
-        asyncio.run(self.async_test_get_source())
-    
-    async def async_test_list_sources(self):
+    async def test_list_sources(self):
         """Test listing data sources."""
         # Register multiple sources
         source1 = DataSource(
@@ -224,12 +203,7 @@ class TestDataManager(unittest.TestCase):
         self.assertIn("source1", source_ids)
         self.assertIn("source2", source_ids)
     
-    def test_list_sources(self):
-        """Test listing data sources."""
-        asyncio.run(self.async_test_list_sources())
-    
-    @patch('core.data.DataManager._connect_database')
-    async def async_test_connect(self, mock_connect):
+    async def test_connect(self):
         """Test connecting to a data source."""
         # Register source
         source = DataSource(
@@ -245,9 +219,9 @@ class TestDataManager(unittest.TestCase):
         await self.data_manager.register_source(source)
         
         # Mock connection
+        mock_connect = self.data_manager._connect_database
         mock_connection = MagicMock()
-        mock_connect.return_value = asyncio.Future()
-        mock_connect.return_value.set_result(mock_connection)
+        mock_connect.return_value = mock_connection
         
         # Connect to source
         result = await self.data_manager.connect("test_source")
@@ -260,12 +234,7 @@ class TestDataManager(unittest.TestCase):
         # Verify mock was called
         mock_connect.assert_called_once()
     
-    def test_connect(self):
-        """Test connecting to a data source."""
-        asyncio.run(self.async_test_connect())
-    
-    @patch('core.data.DataManager._close_database_connection')
-    async def async_test_close_connection(self, mock_close):
+    async def test_close_connection(self):
         """Test closing a connection to a data source."""
         # Register source
         source = DataSource(
@@ -292,14 +261,81 @@ class TestDataManager(unittest.TestCase):
         self.assertNotIn("test_source", self.data_manager.connections)
         
         # Verify mock was called
-        mock_close.assert_called_once_with(mock_connection)
+        self.data_manager._close_database_connection.assert_called_once_with(mock_connection)
     
-    def test_close_connection(self):
-        """Test closing a connection to a data source."""
-        asyncio.run(self.async_test_close_connection())
+    async def test_sqlite_connection_reused(self):
+        """Test that closed SQLite connections are reused from the pool."""
+        # Use a data manager with the real database internals
+        data_manager = DataManager(self.test_data_dir)
+        
+        source = DataSource(
+            source_id="test_source",
+            name="Test Source",
+            type="database",
+            connection_info={
+                "type": "sqlite",
+                "path": os.path.join(self.test_data_dir, "test.db")
+            }
+        )
+        
+        await data_manager.register_source(source)
+        
+        # Connect, close and reconnect
+        self.assertTrue(await data_manager.connect("test_source"))
+        connection = data_manager.connections["test_source"]
+        self.assertTrue(await data_manager.close_connection("test_source"))
+        self.assertTrue(await data_manager.connect("test_source"))
+        
+        # Verify the pooled connection was reused
+        self.assertIs(data_manager.connections["test_source"], connection)
+        
+        # Close everything
+        await data_manager.close()
+        self.assertEqual(data_manager.connections, {})
+        self.assertEqual(data_manager._sqlite_pool, {})
+    
+    async def test_sqlite_pool_isolation(self):
+        """Test that pooled SQLite connections keep sources and transactions separate."""
+        data_manager = DataManager(self.test_data_dir)
+        self.addAsyncCleanup(data_manager.close)
+        db_path = os.path.join(self.test_data_dir, "test.db")
+        
+        for source_id, path in [("mem_a", ":memory:"), ("mem_b", ":memory:"), ("file_a", db_path)]:
+            await data_manager.register_source(DataSource(
+                source_id=source_id,
+                name=source_id,
+                type="database",
+                connection_info={"type": "sqlite", "path": path}
+            ))
+        
+        # In-memory databases are never shared between sources
+        await data_manager.connect("mem_a")
+        data_manager.connections["mem_a"].execute("CREATE TABLE t (x INTEGER)")
+        await data_manager.close_connection("mem_a")
+        await data_manager.connect("mem_b")
+        tables = data_manager.connections["mem_b"].execute("SELECT name FROM sqlite_master").fetchall()
+        self.assertEqual(tables, [])
+        
+        # Uncommitted changes are rolled back when a connection returns to the pool
+        await data_manager.connect("file_a")
+        connection = data_manager.connections["file_a"]
+        connection.execute("CREATE TABLE t (x INTEGER)")
+        connection.commit()
+        connection.execute("INSERT INTO t VALUES (1)")
+        await data_manager.close_connection("file_a")
+        await data_manager.connect("file_a")
+        connection = data_manager.connections["file_a"]
+        connection.commit()
+        self.assertEqual(connection.execute("SELECT COUNT(*) FROM t").fetchone()[0], 0)
+        
+        # Connections not opened through connect() are closed, not pooled or retained
+        source = await data_manager.get_source("file_a")
+        stray = await data_manager._connect_database(source)
+        await data_manager._close_database_connection(stray)
+        self.assertNotIn(stray, data_manager._sqlite_pool.values())
+        self.assertRaises(sqlite3.ProgrammingError, stray.execute, "SELECT 1")
     
-    @patch('core.data.DataManager._execute_sql_query')
-    async def async_test_execute_query(self, mock_execute):
+    async def test_execute_query(self):
         """Test executing a data query."""
         # Register source
         source = DataSource(
@@ -319,9 +355,9 @@ class TestDataManager(unittest.TestCase):
         self.data_manager.connections["test_source"] = mock_connection
         
         # Mock query execution
+        mock_execute = self.data_manager._execute_sql_query
         mock_data = [{"id": 1, "name": "Test"}]
-        mock_execute.return_value = asyncio.Future()
-        mock_execute.return_value.set_result(mock_data)
+        mock_execute.return_value = mock_data
         
         # Create query
         query = DataQuery(
@@ -345,11 +381,7 @@ class TestDataManager(unittest.TestCase):
         # Verify mock was called
         mock_execute.assert_called_once_with(mock_connection, query.query_params)
     
-    def test_execute_query(self):
-        """Test executing a data query."""
-        asyncio.run(self.async_test_execute_query())
-    
-    async def async_test_save_load_data(self):
+    async def test_save_load_data(self):
         """Test saving and loading data."""
         # Create test data
         data = [
@@ -358,15 +390,16 @@ class TestDataManager(unittest.TestCase):
         ]
         
         # Save data as CSV
-        csv_path = os.path.join(self.test_data_dir, "test.csv")
-        result = await self.data_manager.save_data(data, csv_path, "csv")
+        csv_buf = io.BytesIO()
+        result = await self.data_manager.save_data(data, csv_buf, "csv")
         
         # Verify results
         self.assertTrue(result)
-        self.assertTrue(os.path.exists(csv_path))
+        self.assertGreater(csv_buf.tell(), 0)
         
         # Load data from CSV
-        loaded_data = await self.data_manager.load_data(csv_path)
+        csv_buf.seek(0)
+        loaded_data = await self.data_manager.load_data(csv_buf, "csv")
         
         # Verify loaded data
         self.assertIsNotNone(loaded_data)
@@ -376,15 +409,16 @@ class TestDataManager(unittest.TestCase):
         self.assertEqual(loaded_data.iloc[0]["value"], 10.5)
         
         # Save data as JSON
-        json_path = os.path.join(self.test_data_dir, "test.json")
-        result = await self.data_manager.save_data(data, json_path, "json")
+        json_buf = io.BytesIO()
+        result = await self.data_manager.save_data(data, json_buf, "json")
         
         # Verify results
         self.assertTrue(result)
-        self.assertTrue(os.path.exists(json_path))
+        self.assertGreater(json_buf.tell(), 0)
         
         # Load data from JSON
-        loaded_json = await self.data_manager.load_data(json_path)
+        json_buf.seek(0)
+        loaded_json = await self.data_manager.load_data(json_buf, "json")
         
         # Verify loaded data
         self.assertIsNotNone(loaded_json)
@@ -392,19 +426,38 @@ class TestDataManager(unittest.TestCase):
         self.assertEqual(loaded_json[0]["id"], 1)
         self.assertEqual(loaded_json[0]["name"], "Item 1")
         self.assertEqual(loaded_json[0]["value"], 10.5)
+
+
+class TestSingletons(unittest.TestCase):
+    """Test cases for module-level singleton getters."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Set up shared test environment."""
+        cls._tmp = tempfile.TemporaryDirectory(dir=TMP_ROOT)
     
-    def test_save_load_data(self):
-        """Test saving and loading data."""
-        asyncio.run(self.async_test_save_load_data())
+    @classmethod
+    def tearDownClass(cls):
+        """Clean up shared test environment."""
+        cls._tmp.cleanup()
     
     def test_get_data_manager(self):
         """Test getting the singleton data manager."""
         # Get data manager
-        manager1 = get_data_manager(self.test_data_dir)
-        manager2 = get_data_manager(self.test_data_dir)
+        manager1 = get_data_manager(self._tmp.name)
+        manager2 = get_data_manager(self._tmp.name)
         
         # Verify it's the same instance
         self.assertIs(manager1, manager2)
+        self.assertIs(get_data_manager(data_dir=self._tmp.name), manager1)
+        self.assertIs(get_data_manager(self._tmp.name + "/"), manager1)
+    
+    def test_get_data_manager_default_dir(self):
+        """Test that the default directory resolves to one instance however it is requested."""
+        with patch.dict(os.environ, {"HOME": self._tmp.name}):
+            manager = get_data_manager()
+            self.assertIs(get_data_manager(None), manager)
+            self.assertIs(get_data_manager(data_dir=None), manager)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ECLIPSEMOON AI Protocol Framework
+Unit Tests for Utils Module - Datetime Helpers
+Author: ECLIPSEMOON
+"""
+
+import unittest
+import time
+from datetime import datetime, timezone
+
+from core.utils import (
+    timestamp_to_datetime, datetime_to_timestamp, format_datetime, parse_datetime
+)
+
+
+class TestDatetimeFunctions(unittest.TestCase):
+    """Test cases for datetime functions."""
+
+    def test_timestamp_conversions(self):
+        """Test timestamp to datetime and back conversions."""
+        # Get current timestamp
+        now = int(time.time())
+        
+        # Convert to datetime
+        dt = timestamp_to_datetime(now)
+        
+        # Convert back to timestamp
+        timestamp = datetime_to_timestamp(dt)
+        
+        # Verify conversions
+        self.assertEqual(timestamp, now)
+    
+    def test_datetime_formatting(self):
+        """Test datetime formatting and parsing."""
+        # Create datetime
+        dt = datetime(2023, 1, 15, 12, 30, 45, tzinfo=timezone.utc)
+        
+        # Format datetime
+        formatted = format_datetime(dt)
+        self.assertEqual(formatted, "2023-01-15 12:30:45")
+        
+        # Format with custom format
+        formatted = format_datetime(dt, "%Y/%m/%d %H:%M")
+        self.assertEqual(formatted, "2023/01/15 12:30")
+        
+        # Parse datetime
+        parsed = parse_datetime("2023-01-15 12:30:45")
+        self.assertEqual(parsed.year, 2023)
+        self.assertEqual(parsed.month, 1)
+        self.assertEqual(parsed.day, 15)
+        self.assertEqual(parsed.hour, 12)
+        self.assertEqual(parsed.minute, 30)
+        self.assertEqual(parsed.second, 45)
+        
+        # Parse with custom format
+        parsed = parse_datetime("2023/01/15 12:30", "%Y/%m/%d %H:%M")
+        self.assertEqual(parsed.year, 2023)
+        self.assertEqual(parsed.month, 1)
+        self.assertEqual(parsed.day, 15)
+        self.assertEqual(parsed.hour, 12)
+        self.assertEqual(parsed.minute, 30)
+    
+    def test_parse_datetime_rejects_other_layouts(self):
+        """Test that the default format only accepts exact YYYY-MM-DD HH:MM:SS strings."""
+        invalid = [
+            "2023-01-01 12:00+01",   # UTC offset in place of seconds
+            "2023-01-01 120000.5",   # compact time with fraction
+            "2023-01-01T12:00:00",   # ISO 8601 "T" separator
+            "2023-01-01 12:00:0Z",   # non-digit seconds
+        ]
+        
+        for value in invalid:
+            with self.subTest(value=value):
+                self.assertRaises(ValueError, parse_datetime, value)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ECLIPSEMOON AI Protocol Framework
+Unit Tests for Utils Module - Decimal Formatting
+Author: ECLIPSEMOON
+"""
+
+import unittest
+from decimal import Decimal
+
+from core.utils import format_decimal, parse_decimal
+
+
+class TestFormatting(unittest.TestCase):
+    """Test cases for formatting functions."""
+
+    LONG = Decimal("123.45678901234567890")
+    TRAIL = Decimal("123.4000")
+    PARSED = Decimal("123.45")
+
+    def test_format_decimal(self):
+        """Test formatting decimal values."""
+        cases = [
+            # value, kwargs, expected
+            (self.LONG, {}, "123.45678901"),
+            (self.LONG, {"precision": 4}, "123.4568"),
+            (self.TRAIL, {"strip_zeros": False}, "123.40000000"),
+            (self.TRAIL, {"strip_zeros": True}, "123.4"),
+        ]
+        
+        for value, kwargs, expected in cases:
+            with self.subTest(value=value, **kwargs):
+                self.assertEqual(format_decimal(value, **kwargs), expected)
+    
+    def test_parse_decimal(self):
+        """Test parsing decimal values."""
+        cases = [
+            ("123.45", self.PARSED),
+            (123, Decimal("123")),
+            (123.45, self.PARSED),
+            (self.PARSED, self.PARSED),
+        ]
+        
+        for value, expected in cases:
+            with self.subTest(value=value):
+                self.assertEqual(parse_decimal(value), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
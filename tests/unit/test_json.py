@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ECLIPSEMOON AI Protocol Framework
+Unit Tests for Utils Module - JSON Helpers
+Author: ECLIPSEMOON
+"""
+
+import math
+import unittest
+import numpy as np
+from datetime import datetime
+from decimal import Decimal
+from enum import Enum
+from unittest.mock import patch
+
+import core.utils
+from core.utils import to_json, from_json, is_valid_json
+
+# JSON backends to_json can use; orjson is an optional speedup
+_BACKENDS = [("stdlib", None)]
+if core.utils.orjson is not None:
+    _BACKENDS.append(("orjson", core.utils.orjson))
+
+
+class _Side(Enum):
+    BUY = "buy"
+
+
+class TestJsonFunctions(unittest.TestCase):
+    """Test cases for JSON functions."""
+
+    def test_json_serialize(self):
+        """Test JSON serialization."""
+        # Create test object with various types
+        obj = {
+            "string": "test",
+            "integer": 123,
+            "float": 123.45,
+            "decimal": Decimal("123.45"),
+            "datetime": datetime(2023, 1, 15, 12, 30, 45),
+            "list": [1, 2, 3],
+            "set": {4, 5, 6},
+            "nested": {
+                "key": "value"
+            }
+        }
+        
+        # Serialize to JSON
+        json_str = to_json(obj)
+        
+        # Verify serialization
+        self.assertIsNotNone(json_str)
+        
+        # Parse JSON
+        parsed = from_json(json_str)
+        
+        # Verify parsed object
+        self.assertEqual(parsed["string"], "test")
+        self.assertEqual(parsed["integer"], 123)
+        self.assertEqual(parsed["float"], 123.45)
+        self.assertEqual(parsed["decimal"], "123.45")  # Decimal converted to string
+        self.assertTrue("datetime" in parsed)  # Datetime converted to ISO format
+        self.assertEqual(parsed["list"], [1, 2, 3])
+        self.assertEqual(set(parsed["set"]), {4, 5, 6})  # Set converted to list
+        self.assertEqual(parsed["nested"]["key"], "value")
+    
+    def test_to_json_backend_parity(self):
+        """Test that to_json output does not depend on the installed backend."""
+        obj = {"nan": float("nan"), "inf": [float("inf")], "big": 1e16, "small": 0.000099,
+               "np": np.int64(5), "side": _Side.BUY, "text": "café", "list": [1, 2]}
+        cases = [
+            # indent, expected
+            (None, '{"nan":NaN,"inf":[Infinity],"big":1e+16,"small":9.9e-05,"np":5,"side":"buy",'
+                   '"text":"café","list":[1,2]}'),
+            (2, '{\n  "nan": NaN,\n  "inf": [\n    Infinity\n  ],\n  "big": 1e+16,\n  "small": 9.9e-05,\n'
+                '  "np": 5,\n  "side": "buy",\n  "text": "café",\n  "list": [\n    1,\n    2\n  ]\n}'),
+        ]
+        
+        for name, backend in _BACKENDS:
+            for indent, expected in cases:
+                with self.subTest(backend=name, indent=indent), patch.object(core.utils, "orjson", backend):
+                    self.assertEqual(to_json(obj, indent=indent), expected)
+    
+    def test_from_json_matches_json_loads(self):
+        """Test that from_json parses exactly what json.loads does."""
+        big = 10 ** 30
+        self.assertEqual(from_json(f'{{"amount": {big}}}'), {"amount": big})
+        self.assertEqual(from_json('[1e400, "\\ud800"]'), [float("inf"), "\ud800"])
+        self.assertTrue(math.isnan(from_json('NaN')))
+    
+    def test_is_valid_json(self):
+        """Test JSON validation."""
+        # Valid JSON
+        self.assertTrue(is_valid_json('{"key": "value"}'))
+        self.assertTrue(is_valid_json('[1, 2, 3]'))
+        
+        # Invalid JSON
+        self.assertFalse(is_valid_json('{"key": value}'))  # Missing quotes
+        self.assertFalse(is_valid_json('[1, 2, 3'))  # Missing closing bracket
+        
+        # Non-standard input that json.loads accepts
+        for value in ('[NaN]', '1e400', '"\\ud800"'):
+            with self.subTest(value=value):
+                self.assertTrue(is_valid_json(value))
+
+
+if __name__ == '__main__':
+    unittest.main()
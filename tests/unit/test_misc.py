@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ECLIPSEMOON AI Protocol Framework
+Unit Tests for Utils Module - Miscellaneous Utils
+Author: ECLIPSEMOON
+"""
+
+import os
+import unittest
+import numpy as np
+from decimal import Decimal
+from unittest.mock import patch
+
+from core.utils import (
+    safe_divide, truncate_string, get_exception_traceback, get_environment_variable, chunks
+)
+
+
+class TestMiscFunctions(unittest.TestCase):
+    """Test cases for miscellaneous utility functions."""
+
+    def test_safe_divide(self):
+        """Test safe division."""
+        # Normal division
+        result = safe_divide(10, 2)
+        self.assertEqual(result, 5)
+        
+        # Division by zero
+        result = safe_divide(10, 0)
+        self.assertEqual(result, Decimal("0"))
+        
+        # Division by zero with custom default
+        result = safe_divide(10, 0, default=Decimal("999"))
+        self.assertEqual(result, Decimal("999"))
+    
+    def test_truncate_string(self):
+        """Test string truncation."""
+        # String shorter than max length
+        result = truncate_string("Hello", 10)
+        self.assertEqual(result, "Hello")
+        
+        # String longer than max length
+        result = truncate_string("Hello, world!", 10)
+        self.assertEqual(result, "Hello, ...")
+        
+        # String longer than max length with custom suffix
+        result = truncate_string("Hello, world!", 10, suffix="[...]")
+        self.assertEqual(result, "Hello[...]")
+    
+    def test_get_exception_traceback(self):
+        """Test getting exception traceback."""
+        try:
+            # Raise an exception
+            raise ValueError("Test error")
+        except Exception as e:
+            # Get traceback
+            traceback = get_exception_traceback(e)
+            
+            # Verify traceback
+            self.assertIsNotNone(traceback)
+            self.assertIn("ValueError: Test error", traceback)
+    
+    def test_get_environment_variable(self):
+        """Test getting environment variables."""
+        # Set environment variable
+        os.environ["TEST_VAR"] = "test_value"
+        
+        # Get existing variable
+        value = get_environment_variable("TEST_VAR")
+        self.assertEqual(value, "test_value")
+        
+        # Get non-existent variable with default
+        value = get_environment_variable("NON_EXISTENT_VAR", default="default_value")
+        self.assertEqual(value, "default_value")
+        
+        # Get non-existent variable without default
+        value = get_environment_variable("NON_EXISTENT_VAR")
+        self.assertIsNone(value)
+        
+        # Get required non-existent variable
+        self.assertRaises(ValueError, get_environment_variable, "NON_EXISTENT_VAR", required=True)
+    
+    def test_get_environment_variable_tracks_changes(self):
+        """Test that environment changes after a read are picked up."""
+        with patch.dict(os.environ, {"TEST_CHANGING_VAR": "first"}):
+            self.assertEqual(get_environment_variable("TEST_CHANGING_VAR"), "first")
+            os.environ["TEST_CHANGING_VAR"] = "second"
+            self.assertEqual(get_environment_variable("TEST_CHANGING_VAR"), "second")
+        
+        # Removed variables are missing again
+        self.assertRaises(ValueError, get_environment_variable, "TEST_CHANGING_VAR", required=True)
+    
+    def test_chunks(self):
+        """Test splitting a list into chunks."""
+        test_list = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]
+        cases = [
+            # size, expected
+            (3, [[1, 2, 3], [4, 5, 6], [7, 8, 9], [10]]),
+            (5, [[1, 2, 3, 4, 5], [6, 7, 8, 9, 10]]),
+        ]
+        
+        for size, expected in cases:
+            with self.subTest(size=size):
+                self.assertEqual(chunks(test_list, size), expected)
+    
+    def test_chunks_array_like(self):
+        """Test that sliceable non-list containers are still chunked eagerly."""
+        result = chunks(np.arange(1, 8), 3)
+        
+        # Verify a reusable list of slices is returned
+        self.assertEqual(len(result), 3)
+        self.assertEqual([chunk.tolist() for chunk in result], [[1, 2, 3], [4, 5, 6], [7]])
+    
+    def test_chunks_lazy_iterable(self):
+        """Test splitting a non-sliceable iterable into chunks lazily."""
+        result = chunks((x for x in range(1, 8)), 3)
+        
+        # Verify chunks are produced on demand
+        self.assertEqual(next(result), [1, 2, 3])
+        self.assertEqual(list(result), [[4, 5, 6], [7]])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ECLIPSEMOON AI Protocol Framework
+Unit Tests for Utils Module - Result
+Author: ECLIPSEMOON
+"""
+
+import unittest
+
+from core.utils import Result
+
+
+class TestResult(unittest.TestCase):
+    """Test cases for Result class."""
+
+    def test_ok_result(self):
+        """Test creating a successful result."""
+        # Create successful result
+        value = "test_value"
+        message = "Operation successful"
+        result = Result.ok(value, message)
+        
+        # Verify result
+        self.assertTrue(result.success)
+        self.assertEqual(result.value, value)
+        self.assertIsNone(result.error)
+        self.assertEqual(result.message, message)
+        self.assertTrue(bool(result))
+    
+    def test_err_result(self):
+        """Test creating an unsuccessful result."""
+        # Create unsuccessful result
+        error = ValueError("Test error")
+        message = "Operation failed"
+        result = Result.err(error, message)
+        
+        # Verify result
+        self.assertFalse(result.success)
+        self.assertIsNone(result.value)
+        self.assertEqual(result.error, error)
+        self.assertEqual(result.message, message)
+        self.assertFalse(bool(result))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ECLIPSEMOON AI Protocol Framework
+Unit Tests for Utils Module - Retry Decorator
+Author: ECLIPSEMOON
+"""
+
+import unittest
+import time
+from unittest.mock import patch
+
+from core.utils import retry
+
+
+@patch.object(time, "sleep")
+class TestRetry(unittest.TestCase):
+    """Test cases for retry decorator."""
+
+    def test_retry_success(self, mock_sleep):
+        """Test retry decorator with successful function."""
+        # Create function that succeeds
+        @retry(max_attempts=3, delay=0.1)
+        def successful_function():
+            return "Success"
+        
+        # Call function
+        result = successful_function()
+        
+        # Verify result
+        self.assertEqual(result, "Success")
+        self.assertEqual(mock_sleep.call_count, 0)
+    
+    def test_retry_failure(self, mock_sleep):
+        """Test retry decorator with failing function."""
+        # Create function that always fails
+        @retry(max_attempts=3, delay=0.1)
+        def failing_function():
+            raise ValueError("Test error")
+        
+        # Call function and expect exception
+        self.assertRaisesRegex(ValueError, "Test error", failing_function)
+        
+        # Verify it backed off between each attempt
+        self.assertEqual(mock_sleep.call_count, 2)
+    
+    def test_retry_eventual_success(self, mock_sleep):
+        """Test retry decorator with function that eventually succeeds."""
+        # Create counter
+        attempts = [0]
+        
+        # Create function that fails twice then succeeds
+        @retry(max_attempts=3, delay=0.1)
+        def eventual_success():
+            attempts[0] += 1
+            if attempts[0] < 3:
+                raise ValueError("Test error")
+            return "Success"
+        
+        # Call function
+        result = eventual_success()
+        
+        # Verify result
+        self.assertEqual(result, "Success")
+        self.assertEqual(attempts[0], 3)
+        self.assertEqual([c.args for c in mock_sleep.call_args_list], [(0.1,), (0.2,)])
+
+    
+    def test_retry_single_attempt(self, mock_sleep):
+        """Test retry decorator with a single attempt."""
+        # Create function that always fails
+        @retry(max_attempts=1)
+        def failing_function():
+            raise ValueError("Test error")
+        
+        # Call function and expect the failure to be logged and re-raised
+        with self.assertLogs("core.utils", level="ERROR") as logs:
+            self.assertRaises(ValueError, failing_function)
+        
+        self.assertEqual(logs.output, ["ERROR:core.utils:Failed after 1 attempts: Test error"])
+        self.assertEqual(mock_sleep.call_count, 0)
+    
+    def test_retry_rejects_no_attempts(self, mock_sleep):
+        """Test retry decorator with fewer than one attempt."""
+        self.assertRaises(ValueError, retry, max_attempts=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+ECLIPSEMOON AI Protocol Framework
+Unit Tests for Utils Module - Timer
+Author: ECLIPSEMOON
+"""
+
+import unittest
+import time
+
+from core.utils import Timer
+
+
+class TestTimer(unittest.TestCase):
+    """Test cases for Timer class."""
+
+    def test_timer_context_manager(self):
+        """Test using Timer as a context manager."""
+        # Use timer as context manager
+        with Timer("Test timer") as timer:
+            time.sleep(0.1)
+        
+        # Verify timer
+        self.assertIsNotNone(timer.start_time)
+        self.assertIsNotNone(timer.end_time)
+        self.assertGreaterEqual(timer.elapsed(), 0.1)
+    
+    def test_timer_manual(self):
+        """Test using Timer manually."""
+        # Create timer
+        timer = Timer("Manual timer")
+        
+        # Start timer
+        timer.start()
+        time.sleep(0.1)
+        
+        # Get elapsed time
+        elapsed1 = timer.elapsed()
+        self.assertGreaterEqual(elapsed1, 0.1)
+        
+        # Stop timer
+        elapsed2 = timer.stop()
+        self.assertGreaterEqual(elapsed2, 0.1)
+        
+        # Verify timer
+        self.assertIsNotNone(timer.start_time)
+        self.assertIsNotNone(timer.end_time)
+        self.assertEqual(timer.elapsed(), elapsed2)
+
+
+if __name__ == '__main__':
+    unittest.main()